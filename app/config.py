@@ -4,14 +4,23 @@ Handles environment variables and application settings.
 """
 
 import os
-from typing import List, Optional
-from pydantic import BaseModel, validator
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List, Optional
+from pydantic import BaseModel, model_validator, validator
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Collection fields that may be supplied as comma-separated strings, with the
+# container each is parsed into (frozensets for hot-path membership checks)
+_CSV_FIELDS = {
+    "allowed_origins": list,
+    "allowed_video_formats": frozenset,
+    "supported_resolutions": frozenset,
+}
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -25,16 +34,19 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = 0  # run.py worker processes (0 = one per CPU; always 1 in debug)
     
     # Firebase Configuration
     firebase_project_id: str
     firebase_service_account_key_path: Optional[str] = None
     firebase_service_account_key_json: Optional[str] = None
+    firebase_pool_size: int = 40  # Threads for blocking Firebase Auth / Firestore SDK calls
     
     # Google Cloud Configuration
     google_cloud_project_id: str
     google_cloud_storage_bucket: str
     google_cloud_region: str = "us-central1"
+    gcs_pool_size: int = 32  # Threads for blocking Cloud Storage SDK calls
     
     # CORS Configuration
     allowed_origins: List[str] = ["http://localhost:3000", "http://localhost:3001"]
@@ -43,19 +55,33 @@ class Settings(BaseSettings):
     secret_key: str
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    token_cache_ttl: int = 300  # Seconds a verified ID token is reused (capped at its exp)
+    token_cache_size: int = 10_000
     
     # File Upload Limits
     max_file_size_mb: int = 500
-    max_file_size_bytes: int = 500 * 1024 * 1024
-    allowed_video_formats: List[str] = ["video/mp4", "video/avi", "video/mov", "video/mkv", "video/webm"]
+    allowed_video_formats: FrozenSet[str] = frozenset({"video/mp4", "video/avi", "video/mov", "video/mkv", "video/webm"})
     
     # Video Processing
     max_concurrent_jobs: int = 5
+    media_pool_size: int = 16  # Threads for blocking FFmpeg pipe I/O and process waits
     job_timeout_minutes: int = 60
     default_video_quality: str = "high"
-    supported_resolutions: List[str] = ["720p", "1080p", "1440p", "4K"]
+    supported_resolutions: FrozenSet[str] = frozenset({"720p", "1080p", "1440p", "4K"})
+    tensorrt_engine_cache_dir: str = "/tmp/tensorrt_engines"  # Built engines, reused across jobs
+    video_hwaccel: bool = False  # NVDEC/NVENC on GPU workers (needs an FFmpeg built with CUDA)
+    # Frames per depth-estimation forward pass. Fixed server-side: each value is
+    # a separate compiled graph / TensorRT engine, and pinned buffers scale with it
+    depth_batch_size: int = 8
+    
+    # Lookup Caching (disable in tests to always hit Firestore)
+    cache_enabled: bool = True
+    cache_max_entries: int = 10_000
+    video_cache_ttl_seconds: float = 30.0
+    job_cache_ttl_seconds: float = 2.0
     
     # Rate Limiting
+    cloud_tasks_max_qps: int = 500
     rate_limit_requests_per_minute: int = 60
     rate_limit_upload_per_hour: int = 10
     rate_limit_convert_per_hour: int = 5
@@ -64,37 +90,16 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_format: str = "json"
     
-    @validator("allowed_origins", pre=True)
+    @model_validator(mode="before")
     @classmethod
-    def parse_allowed_origins(cls, v):
-        """Parse comma-separated origins string."""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
-    
-    @validator("allowed_video_formats", pre=True)
-    @classmethod
-    def parse_allowed_video_formats(cls, v):
-        """Parse comma-separated video formats string."""
-        if isinstance(v, str):
-            return [format.strip() for format in v.split(",")]
-        return v
-    
-    @validator("supported_resolutions", pre=True)
-    @classmethod
-    def parse_supported_resolutions(cls, v):
-        """Parse comma-separated resolutions string."""
-        if isinstance(v, str):
-            return [resolution.strip() for resolution in v.split(",")]
-        return v
-    
-    @validator("max_file_size_bytes", pre=True)
-    @classmethod
-    def calculate_max_file_size_bytes(cls, v, values):
-        """Calculate max file size in bytes from MB."""
-        if "max_file_size_mb" in values:
-            return values["max_file_size_mb"] * 1024 * 1024
-        return v
+    def _split_csvs(cls, data):
+        """Parse comma-separated collection fields in a single pass."""
+        if isinstance(data, dict):
+            for key, container in _CSV_FIELDS.items():
+                value = data.get(key)
+                if isinstance(value, str):
+                    data[key] = container(item.strip() for item in value.split(","))
+        return data
     
     @validator("debug", pre=True)
     @classmethod
@@ -104,18 +109,17 @@ class Settings(BaseSettings):
             return v.lower() in ("true", "1", "yes", "on")
         return v
     
+    @cached_property
+    def max_file_size_bytes(self) -> int:
+        """Max file size in bytes, derived from max_file_size_mb."""
+        return self.max_file_size_mb << 20
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
-# Global settings instance (lazy initialization)
-_settings = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get application settings (instantiated once and cached)."""
+    return Settings()
@@ -2,38 +2,46 @@
 Main FastAPI application for VR 180 Video Processing Platform.
 """
 import os
+import asyncio
 import logging
+import orjson
 import structlog
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.config import get_settings
-from app.middleware.auth_middleware import AuthMiddleware, OptionalAuthMiddleware
+from app.middleware.auth_middleware import AuthMiddleware
 from app.middleware.rate_limit_middleware import RateLimitMiddleware, EndpointRateLimitMiddleware
 from app.middleware.cors_middleware import setup_cors_middleware
 from app.routes import auth_router, videos_router, system_router, internal_router
-from app.models.system import ErrorResponse
+from app.services.executors import firebase_executor, gcs_executor, run_blocking, shutdown_executors
+from app.services.firebase_service import firebase_service
+from app.services.gcs_service import gcs_service
+from app.utils.responses import error_body
 
-# Configure structured logging
+settings = get_settings()
+
+# Configure structured logging; calls below the configured level are
+# filtered out by the bound logger before any processor runs
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
         structlog.processors.JSONRenderer()
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
+    wrapper_class=structlog.make_filtering_bound_logger(
+        getattr(logging, settings.log_level.upper(), logging.INFO)
+    ),
     cache_logger_on_first_use=True,
 )
 
@@ -53,8 +61,7 @@ async def lifespan(app: FastAPI):
     
     try:
         # Initialize services
-        settings = get_settings()
-        logger.info(f"Application starting in {settings.environment} mode")
+        logger.info("Application starting", environment=settings.environment)
         
         # Log configuration (without sensitive data)
         logger.info(
@@ -66,14 +73,30 @@ async def lifespan(app: FastAPI):
             gcs_bucket=settings.google_cloud_storage_bucket
         )
         
+        # Build the shared clients now so the first request doesn't pay for
+        # credential discovery and channel setup
+        for result in await asyncio.gather(
+            run_blocking(firebase_executor, lambda: firebase_service.db),
+            run_blocking(gcs_executor, lambda: gcs_service.bucket),
+            return_exceptions=True
+        ):
+            if isinstance(result, Exception):
+                logger.warning("Client warmup failed", error=str(result))
+        
+        # Keep token-verification keys cached so no request waits on the download
+        key_refresher = asyncio.create_task(firebase_service.refresh_public_keys_forever())
+        
         yield
         
     except Exception as e:
-        logger.error(f"Startup failed: {e}")
+        logger.error("Startup failed", error=str(e))
         raise
     
     # Shutdown
     logger.info("Shutting down VR 180 Video Processing Platform")
+    key_refresher.cancel()
+    await firebase_service.flush_logins()
+    shutdown_executors()
 
 
 def create_app() -> FastAPI:
@@ -83,16 +106,17 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI application instance
     """
-    settings = get_settings()
+    is_dev = settings.environment == "development"
     
     # Create FastAPI app
     app = FastAPI(
         title=settings.app_name,
         version=settings.app_version,
         description="VR 180 Video Processing Platform - Convert 2D videos to immersive VR 180° format using AI-powered depth estimation",
-        docs_url="/docs" if settings.environment == "development" else None,
-        redoc_url="/redoc" if settings.environment == "development" else None,
-        openapi_url="/openapi.json" if settings.environment == "development" else None,
+        docs_url="/docs" if is_dev else None,
+        redoc_url="/redoc" if is_dev else None,
+        openapi_url="/openapi.json" if is_dev else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
@@ -108,7 +132,7 @@ def create_app() -> FastAPI:
     # Add endpoint-specific rate limiting
     app.add_middleware(EndpointRateLimitMiddleware)
     
-    # Add authentication middleware (exclude certain paths)
+    # Add authentication middleware (excluded paths still get user context when a token is sent)
     excluded_auth_paths = [
         "/",
         "/health",
@@ -125,36 +149,37 @@ def create_app() -> FastAPI:
         excluded_paths=excluded_auth_paths
     )
     
-    # Add optional authentication middleware for internal routes
-    app.add_middleware(OptionalAuthMiddleware)
-    
     # Include routers
     app.include_router(auth_router)
     app.include_router(videos_router)
     app.include_router(system_router)
     app.include_router(internal_router)
     
+    # Static payloads for root and health endpoints, serialized once (settings never change at runtime)
+    root_body = orjson.dumps({
+        "message": "VR 180 Video Processing Platform API",
+        "version": settings.app_version,
+        "environment": settings.environment,
+        "docs_url": "/docs" if is_dev else None,
+        "health_check": "/health"
+    })
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "service": "vr180-video-processing",
+        "version": settings.app_version
+    })
+    
     # Add root endpoint
     @app.get("/", tags=["Root"])
     async def root():
         """Root endpoint with API information."""
-        return {
-            "message": "VR 180 Video Processing Platform API",
-            "version": settings.app_version,
-            "environment": settings.environment,
-            "docs_url": "/docs" if settings.environment == "development" else None,
-            "health_check": "/health"
-        }
+        return Response(content=root_body, media_type="application/json")
     
     # Add health check endpoint (without auth)
     @app.get("/health", tags=["Health"])
     async def health():
         """Simple health check endpoint."""
-        return {
-            "status": "healthy",
-            "service": "vr180-video-processing",
-            "version": settings.app_version
-        }
+        return Response(content=health_body, media_type="application/json")
     
     # Global exception handlers
     @app.exception_handler(HTTPException)
@@ -168,13 +193,13 @@ def create_app() -> FastAPI:
             method=request.method
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
-            content=ErrorResponse(
-                error="HTTP Error",
-                message=exc.detail,
+            content=error_body(
+                "HTTP Error",
+                exc.detail,
                 timestamp=exc.timestamp if hasattr(exc, 'timestamp') else None
-            ).dict()
+            )
         )
     
     @app.exception_handler(StarletteHTTPException)
@@ -188,12 +213,9 @@ def create_app() -> FastAPI:
             method=request.method
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
-            content=ErrorResponse(
-                error="HTTP Error",
-                message=exc.detail
-            ).dict()
+            content=error_body("HTTP Error", exc.detail)
         )
     
     @app.exception_handler(RequestValidationError)
@@ -206,13 +228,13 @@ def create_app() -> FastAPI:
             method=request.method
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content=ErrorResponse(
-                error="Validation Error",
-                message="Request validation failed",
-                details={"errors": exc.errors()}
-            ).dict()
+            content=error_body(
+                "Validation Error",
+                "Request validation failed",
+                details={"errors": jsonable_encoder(exc.errors())}
+            )
         )
     
     @app.exception_handler(Exception)
@@ -226,12 +248,12 @@ def create_app() -> FastAPI:
             exc_info=True
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=ErrorResponse(
-                error="Internal Server Error",
-                message="An unexpected error occurred"
-            ).dict()
+            content=error_body(
+                "Internal Server Error",
+                "An unexpected error occurred"
+            )
         )
     
     return app
@@ -248,6 +270,8 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=port,
+        loop="uvloop",
+        http="httptools",
         reload=False,                # disable reload in production
         log_level="info",            # or settings.log_level.lower()
         access_log=True
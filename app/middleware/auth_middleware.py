@@ -2,31 +2,80 @@
 Authentication middleware for Firebase JWT token validation.
 """
 
-import logging
+import re
 from typing import Optional, Dict, Any
+import structlog
 from fastapi import Request, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import QueryParams
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.services.firebase_service import firebase_service
 from app.models.auth import TokenData
+from app.utils.responses import error_body
 
-logger = logging.getLogger(__name__)
+logger = structlog.get_logger(__name__)
 
+# Firebase service is imported on first use to keep the Admin SDK out of cold start
+_firebase_service = None
 
-class AuthMiddleware(BaseHTTPMiddleware):
+
+def _get_fb():
+    """Return the Firebase service, importing it on first use."""
+    global _firebase_service
+    if _firebase_service is None:
+        from app.services.firebase_service import firebase_service as _fs
+        _firebase_service = _fs
+    return _firebase_service
+
+
+def _extract_token_from_scope(scope) -> Optional[str]:
+    """
+    Extract JWT token from the raw ASGI scope.
+    
+    Args:
+        scope: ASGI connection scope
+        
+    Returns:
+        JWT token string or None
+    """
+    # Try Authorization header first
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            if value.startswith(b"Bearer "):
+                return value[7:].decode("latin-1")
+            break
+    
+    # Try query parameter (for WebSocket connections)
+    query_string = scope.get("query_string")
+    if query_string:
+        token = QueryParams(query_string).get("token")
+        if token:
+            return token
+    
+    return None
+
+
+def _unauthorized(detail: str) -> JSONResponse:
+    """Build a 401 response in the same shape as the app's HTTP error handler."""
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content=error_body("HTTP Error", detail),
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+class AuthMiddleware:
     """Authentication middleware for Firebase JWT validation."""
     
-    def __init__(self, app, excluded_paths: Optional[list] = None):
+    def __init__(self, app: ASGIApp, excluded_paths: Optional[list] = None):
         """
         Initialize authentication middleware.
         
         Args:
-            app: FastAPI application
+            app: ASGI application
             excluded_paths: List of paths to exclude from authentication
         """
-        super().__init__(app)
+        self.app = app
         self.excluded_paths = excluded_paths or [
             "/",
             "/health",
@@ -36,57 +85,63 @@ class AuthMiddleware(BaseHTTPMiddleware):
             "/auth/register",
             "/auth/login"
         ]
-        self.security = HTTPBearer(auto_error=False)
+        # Single anchored alternation: "/" only matches exactly (as a prefix it
+        # would match every path), every other entry matches as a prefix
+        self._skip_re = re.compile(
+            "|".join(
+                re.escape(p) + (r"\Z" if p == "/" else "")
+                for p in self.excluded_paths
+            )
+        )
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process request and validate authentication.
+        Authenticate HTTP requests and pass them on.
+        
+        A presented token is always verified so user context is available on
+        excluded paths too; a missing or invalid token only yields a 401 when
+        the path is not excluded. ``request.state.token_data`` is always set,
+        to None for unauthenticated requests.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response from next handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip authentication for excluded paths
-        if self._should_skip_auth(request.url.path):
-            return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        skip_auth = self._should_skip_auth(scope["path"])
+        # token_data is always set (None when unauthenticated) so helpers can read it directly
+        state = scope.setdefault("state", {})
+        state["token_data"] = None
+        
+        # Extract token from Authorization header
+        token = _extract_token_from_scope(scope)
+        
+        if not token:
+            if not skip_auth:
+                await _unauthorized("Authorization token required")(scope, receive, send)
+                return
+        else:
+            try:
+                # Verify token with Firebase
+                token_data = await _get_fb().verify_token(token)
+            except Exception as e:
+                if not skip_auth:
+                    logger.error("Authentication error", error=str(e))
+                    await _unauthorized("Invalid authentication token")(scope, receive, send)
+                    return
+                logger.debug("Optional auth failed", error=str(e))
+            else:
+                # Add user context to request state
+                state["token_data"] = token_data
+                
+                logger.debug("User authenticated", user_id=token_data.user_id)
         
-        try:
-            # Extract token from Authorization header
-            token = await self._extract_token(request)
-            
-            if not token:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Authorization token required",
-                    headers={"WWW-Authenticate": "Bearer"}
-                )
-            
-            # Verify token with Firebase
-            token_data = await firebase_service.verify_token(token)
-            
-            # Add user context to request state
-            request.state.user_id = token_data.user_id
-            request.state.user_email = token_data.email
-            request.state.token_data = token_data
-            
-            logger.debug(f"User authenticated: {token_data.user_id}")
-            
-            # Continue to next handler
-            response = await call_next(request)
-            return response
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Authentication error: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication token",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
+        # Continue to next handler
+        await self.app(scope, receive, send)
     
     def _should_skip_auth(self, path: str) -> bool:
         """
@@ -98,109 +153,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Returns:
             True if authentication should be skipped
         """
-        # Check exact matches
-        if path in self.excluded_paths:
-            return True
-        
-        # Check if path starts with excluded prefix
-        for excluded_path in self.excluded_paths:
-            if path.startswith(excluded_path):
-                return True
-        
-        return False
-    
-    async def _extract_token(self, request: Request) -> Optional[str]:
-        """
-        Extract JWT token from request.
-        
-        Args:
-            request: Incoming request
-            
-        Returns:
-            JWT token string or None
-        """
-        # Try Authorization header first
-        authorization = request.headers.get("Authorization")
-        if authorization and authorization.startswith("Bearer "):
-            return authorization.split(" ")[1]
-        
-        # Try query parameter (for WebSocket connections)
-        token = request.query_params.get("token")
-        if token:
-            return token
-        
-        return None
-
-
-class OptionalAuthMiddleware(BaseHTTPMiddleware):
-    """Optional authentication middleware that doesn't require auth but adds user context if available."""
-    
-    def __init__(self, app):
-        """Initialize optional authentication middleware."""
-        super().__init__(app)
-        self.security = HTTPBearer(auto_error=False)
-    
-    async def dispatch(self, request: Request, call_next):
-        """
-        Process request with optional authentication.
-        
-        Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response from next handler
-        """
-        try:
-            # Try to extract and verify token
-            token = await self._extract_token(request)
-            
-            if token:
-                try:
-                    token_data = await firebase_service.verify_token(token)
-                    request.state.user_id = token_data.user_id
-                    request.state.user_email = token_data.email
-                    request.state.token_data = token_data
-                    request.state.authenticated = True
-                    
-                    logger.debug(f"Optional auth successful: {token_data.user_id}")
-                except Exception as e:
-                    logger.debug(f"Optional auth failed: {e}")
-                    request.state.authenticated = False
-            else:
-                request.state.authenticated = False
-            
-            # Continue to next handler
-            response = await call_next(request)
-            return response
-            
-        except Exception as e:
-            logger.error(f"Optional authentication error: {e}")
-            request.state.authenticated = False
-            response = await call_next(request)
-            return response
-    
-    async def _extract_token(self, request: Request) -> Optional[str]:
-        """
-        Extract JWT token from request.
-        
-        Args:
-            request: Incoming request
-            
-        Returns:
-            JWT token string or None
-        """
-        # Try Authorization header first
-        authorization = request.headers.get("Authorization")
-        if authorization and authorization.startswith("Bearer "):
-            return authorization.split(" ")[1]
-        
-        # Try query parameter
-        token = request.query_params.get("token")
-        if token:
-            return token
-        
-        return None
+        return self._skip_re.match(path) is not None
 
 
 def get_current_user(request: Request) -> TokenData:
@@ -216,13 +169,14 @@ def get_current_user(request: Request) -> TokenData:
     Raises:
         HTTPException: If user is not authenticated
     """
-    if not hasattr(request.state, 'token_data'):
+    token_data = request.state.token_data
+    if token_data is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not authenticated"
         )
     
-    return request.state.token_data
+    return token_data
 
 
 def get_current_user_id(request: Request) -> str:
@@ -238,13 +192,7 @@ def get_current_user_id(request: Request) -> str:
     Raises:
         HTTPException: If user is not authenticated
     """
-    if not hasattr(request.state, 'user_id'):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not authenticated"
-        )
-    
-    return request.state.user_id
+    return get_current_user(request).user_id
 
 
 def get_current_user_email(request: Request) -> str:
@@ -260,13 +208,7 @@ def get_current_user_email(request: Request) -> str:
     Raises:
         HTTPException: If user is not authenticated
     """
-    if not hasattr(request.state, 'user_email'):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not authenticated"
-        )
-    
-    return request.state.user_email
+    return get_current_user(request).email
 
 
 def is_authenticated(request: Request) -> bool:
@@ -279,4 +221,4 @@ def is_authenticated(request: Request) -> bool:
     Returns:
         True if user is authenticated, False otherwise
     """
-    return hasattr(request.state, 'authenticated') and request.state.authenticated
+    return request.state.token_data is not None
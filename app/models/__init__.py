@@ -6,6 +6,7 @@ from .auth import (
     UserRegister,
     UserLogin,
     UserProfile,
+    ProfileUpdate,
     AuthResponse,
     TokenData
 )
@@ -31,6 +32,7 @@ __all__ = [
     "UserRegister",
     "UserLogin", 
     "UserProfile",
+    "ProfileUpdate",
     "AuthResponse",
     "TokenData",
     "VideoUpload",
@@ -2,10 +2,15 @@
 Authentication-related Pydantic models.
 """
 
+import re
+from dataclasses import dataclass
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from datetime import datetime
 
+# Cheap format check for login; registration keeps full EmailStr validation
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class UserRegister(BaseModel):
     """User registration request model."""
@@ -14,31 +19,55 @@ class UserRegister(BaseModel):
     password: str = Field(..., min_length=8, max_length=128, description="User password")
     display_name: str = Field(..., min_length=2, max_length=50, description="User display name")
     
-    @validator("password")
+    @field_validator("password")
     @classmethod
-    def validate_password(cls, v):
+    def validate_password(cls, v: str) -> str:
         """Validate password strength."""
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isupper() for c in v):
+        
+        # Single pass over the string, checking ASCII ranges
+        has_upper = has_lower = has_digit = False
+        for c in v:
+            o = ord(c)
+            if 65 <= o <= 90:
+                has_upper = True
+            elif 97 <= o <= 122:
+                has_lower = True
+            elif 48 <= o <= 57:
+                has_digit = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit:
+                return v
+        
+        if not has_upper:
             raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
+        if not has_lower:
             raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        raise ValueError("Password must contain at least one digit")
 
 
 class UserLogin(BaseModel):
     """User login request model."""
     
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., description="User email address")
     password: str = Field(..., description="User password")
+    
+    @field_validator("email")
+    @classmethod
+    def validate_email_format(cls, v):
+        """Validate email format and normalize case."""
+        if not _EMAIL_RE.match(v):
+            raise ValueError("Invalid email address")
+        return v.lower()
 
 
 class UserProfile(BaseModel):
     """User profile information model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     user_id: str = Field(..., description="Unique user identifier")
     email: EmailStr = Field(..., description="User email address")
     display_name: str = Field(..., description="User display name")
@@ -50,21 +79,35 @@ class UserProfile(BaseModel):
     storage_used_mb: float = Field(0.0, description="Storage used in MB")
 
 
+class ProfileUpdate(BaseModel):
+    """User profile update request model."""
+    
+    model_config = ConfigDict(extra="ignore")
+    
+    display_name: Optional[str] = Field(None, description="User display name")
+    subscription_tier: Optional[str] = Field(None, description="User subscription tier")
+
+
 class AuthResponse(BaseModel):
     """Authentication response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     user_id: str = Field(..., description="Unique user identifier")
     custom_token: str = Field(..., description="Firebase custom token")
     user_info: Optional[UserProfile] = Field(None, description="User profile information")
     expires_in: int = Field(3600, description="Token expiration time in seconds")
 
 
-class TokenData(BaseModel):
-    """Token data extracted from JWT."""
+@dataclass(frozen=True)
+class TokenData:
+    """Token data extracted from JWT (plain slotted container, built once per verification)."""
+    
+    __slots__ = ("user_id", "email", "exp", "iat", "iss", "aud")
     
-    user_id: str = Field(..., description="User ID from token")
-    email: str = Field(..., description="Email from token")
-    exp: int = Field(..., description="Token expiration timestamp")
-    iat: int = Field(..., description="Token issued at timestamp")
-    iss: str = Field(..., description="Token issuer")
-    aud: str = Field(..., description="Token audience")
+    user_id: str  # User ID from token
+    email: str  # Email from token
+    exp: int  # Token expiration timestamp
+    iat: int  # Token issued at timestamp
+    iss: str  # Token issuer
+    aud: str  # Token audience
@@ -2,11 +2,21 @@
 Video-related Pydantic models.
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from datetime import datetime
 from enum import Enum
 
+# Content types accepted for upload, validated by pydantic-core without a Python callback
+VideoContentTypeLiteral = Literal[
+    "video/mp4",
+    "video/avi",
+    "video/mov",
+    "video/mkv",
+    "video/webm",
+    "video/quicktime"
+]
+
 
 class VideoStatusEnum(str, Enum):
     """Video processing status enumeration."""
@@ -38,11 +48,19 @@ class VideoResolutionEnum(str, Enum):
     UHD_4K = "4K"
 
 
+# Literal aliases used for field validation; pydantic-core checks these with a
+# hash lookup instead of enum coercion. The enums above remain for use as
+# constants in application code (pass ``.value`` when building models).
+VideoStatusLiteral = Literal["uploading", "uploaded", "queued", "processing", "completed", "failed", "cancelled"]
+VideoQualityLiteral = Literal["low", "medium", "high", "ultra"]
+VideoResolutionLiteral = Literal["720p", "1080p", "1440p", "4K"]
+
+
 class ConversionSettings(BaseModel):
     """Video conversion settings model."""
     
-    resolution: VideoResolutionEnum = Field(VideoResolutionEnum.HD_1080P, description="Output resolution")
-    quality: VideoQualityEnum = Field(VideoQualityEnum.HIGH, description="Output quality")
+    resolution: VideoResolutionLiteral = Field("1080p", description="Output resolution")
+    quality: VideoQualityLiteral = Field("high", description="Output quality")
     frame_rate: Optional[int] = Field(30, ge=15, le=60, description="Output frame rate")
     bitrate: Optional[int] = Field(None, ge=1000, le=50000, description="Output bitrate in kbps")
     stereo_mode: str = Field("side-by-side", description="Stereo mode for VR180")
@@ -52,32 +70,18 @@ class ConversionSettings(BaseModel):
 class VideoUpload(BaseModel):
     """Video upload request model."""
     
-    filename: str = Field(..., min_length=1, max_length=255, description="Original filename")
-    content_type: str = Field(..., description="MIME type of the video file")
+    filename: Annotated[str, StringConstraints(min_length=1, max_length=255), Field(description="Original filename")]
+    content_type: VideoContentTypeLiteral = Field(..., description="MIME type of the video file")
     file_size: int = Field(..., gt=0, description="File size in bytes")
-    title: Optional[str] = Field(None, max_length=100, description="Video title")
-    description: Optional[str] = Field(None, max_length=500, description="Video description")
-    
-    @validator("content_type")
-    @classmethod
-    def validate_content_type(cls, v):
-        """Validate video content type."""
-        allowed_types = [
-            "video/mp4",
-            "video/avi", 
-            "video/mov",
-            "video/mkv",
-            "video/webm",
-            "video/quicktime"
-        ]
-        if v not in allowed_types:
-            raise ValueError(f"Unsupported video format: {v}")
-        return v
+    title: Optional[Annotated[str, StringConstraints(max_length=100)]] = Field(None, description="Video title")
+    description: Optional[Annotated[str, StringConstraints(max_length=500)]] = Field(None, description="Video description")
 
 
 class VideoUploadResponse(BaseModel):
     """Video upload response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     video_id: str = Field(..., description="Unique video identifier")
     signed_upload_url: str = Field(..., description="Signed URL for direct upload")
     upload_metadata: Dict[str, Any] = Field(..., description="Upload metadata")
@@ -95,20 +99,24 @@ class VideoConvert(BaseModel):
 class VideoConvertResponse(BaseModel):
     """Video conversion response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     job_id: str = Field(..., description="Unique job identifier")
     video_id: str = Field(..., description="Video ID being converted")
     estimated_time_minutes: int = Field(..., description="Estimated processing time")
-    status: VideoStatusEnum = Field(..., description="Current job status")
+    status: VideoStatusLiteral = Field(..., description="Current job status")
     queue_position: Optional[int] = Field(None, description="Position in processing queue")
 
 
 class VideoStatus(BaseModel):
     """Video processing status model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     job_id: str = Field(..., description="Job identifier")
     video_id: str = Field(..., description="Video identifier")
-    status: VideoStatusEnum = Field(..., description="Current processing status")
-    progress_percentage: float = Field(0.0, ge=0.0, le=100.0, description="Processing progress")
+    status: VideoStatusLiteral = Field(..., description="Current processing status")
+    progress_percentage: Annotated[float, Field(ge=0.0, le=100.0, description="Processing progress")] = 0.0
     stage: str = Field(..., description="Current processing stage")
     eta_minutes: Optional[int] = Field(None, description="Estimated time to completion")
     error_message: Optional[str] = Field(None, description="Error message if failed")
@@ -120,6 +128,8 @@ class VideoStatus(BaseModel):
 class VideoInfo(BaseModel):
     """Video information model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     video_id: str = Field(..., description="Unique video identifier")
     user_id: str = Field(..., description="Owner user ID")
     title: Optional[str] = Field(None, description="Video title")
@@ -134,15 +144,20 @@ class VideoInfo(BaseModel):
     converted_url: Optional[str] = Field(None, description="Converted VR180 video URL")
     thumbnail_url: Optional[str] = Field(None, description="Video thumbnail URL")
     preview_url: Optional[str] = Field(None, description="VR preview URL")
-    status: VideoStatusEnum = Field(..., description="Current status")
+    status: VideoStatusLiteral = Field(..., description="Current status")
     created_at: datetime = Field(..., description="Upload timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     conversion_settings: Optional[ConversionSettings] = Field(None, description="Conversion settings used")
+    blob_paths: Optional[List[str]] = Field(
+        None, exclude=True, description="Storage object paths written for this video (internal)"
+    )
 
 
 class VideoDownload(BaseModel):
     """Video download response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     download_url: str = Field(..., description="Signed download URL")
     filename: str = Field(..., description="Download filename")
     content_type: str = Field(..., description="File MIME type")
@@ -153,6 +168,8 @@ class VideoDownload(BaseModel):
 class VideoPreview(BaseModel):
     """Video preview response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     preview_url: str = Field(..., description="VR preview player URL")
     thumbnail_url: str = Field(..., description="Video thumbnail URL")
     metadata: Dict[str, Any] = Field(..., description="Preview metadata")
@@ -162,6 +179,8 @@ class VideoPreview(BaseModel):
 class VideoList(BaseModel):
     """User video list response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     videos: List[VideoInfo] = Field(..., description="List of user videos")
     total_count: int = Field(..., description="Total number of videos")
     page: int = Field(1, description="Current page number")
@@ -2,23 +2,72 @@
 Authentication API routes.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import re
+from typing import Dict, Optional, Tuple
+import firebase_admin.auth as firebase_auth
 from fastapi import APIRouter, HTTPException, status, Depends, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 
-from app.models.auth import UserRegister, UserLogin, UserProfile, AuthResponse
+from app.models.auth import UserRegister, UserLogin, UserProfile, ProfileUpdate, AuthResponse
+from app.services.executors import firebase_executor, run_blocking
 from app.services.firebase_service import firebase_service
 from app.middleware.auth_middleware import get_current_user, get_current_user_id
 from app.models.auth import TokenData
+from app.utils.responses import orjson_response
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["Authentication"],
+    default_response_class=ORJSONResponse
+)
 security = HTTPBearer()
 
+create_custom_token = firebase_auth.create_custom_token
 
-@router.post("/register", response_model=AuthResponse)
+# Error responses as (status code, detail), keyed by Firebase error code.
+# A fresh HTTPException is raised per request so no exception state (or the
+# request it was raised from) is shared between requests.
+_INVALID_CREDENTIALS = (status.HTTP_401_UNAUTHORIZED, "Invalid email or password")
+
+_REGISTER_ERRORS: Dict[str, Tuple[int, str]] = {
+    "email-already-exists": (status.HTTP_409_CONFLICT, "Email address is already registered"),
+    "invalid-email": (status.HTTP_400_BAD_REQUEST, "Invalid email address format"),
+    "weak-password": (status.HTTP_400_BAD_REQUEST, "Password is too weak"),
+}
+_REGISTRATION_FAILED = (status.HTTP_500_INTERNAL_SERVER_ERROR, "Registration failed. Please try again.")
+
+_LOGIN_ERRORS: Dict[str, Tuple[int, str]] = {
+    "user-not-found": _INVALID_CREDENTIALS,
+    "wrong-password": _INVALID_CREDENTIALS,
+    "user-disabled": (status.HTTP_403_FORBIDDEN, "User account has been disabled"),
+    "too-many-requests": (
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        "Too many failed login attempts. Please try again later."
+    ),
+}
+_LOGIN_FAILED = (
+    status.HTTP_401_UNAUTHORIZED,
+    "Authentication failed. Please check your credentials."
+)
+
+# Matches any known Firebase error code in an exception message
+_FIREBASE_ERROR_CODE_RE = re.compile(
+    "|".join(re.escape(code) for code in (*_REGISTER_ERRORS, *_LOGIN_ERRORS))
+)
+
+
+def _firebase_error_code(error: Exception) -> Optional[str]:
+    """Extract a known Firebase error code from an exception message."""
+    match = _FIREBASE_ERROR_CODE_RE.search(str(error))
+    return match.group(0) if match else None
+
+
+@router.post("/register")
 async def register_user(user_data: UserRegister) -> AuthResponse:
     """
     Register a new user.
@@ -33,7 +82,7 @@ async def register_user(user_data: UserRegister) -> AuthResponse:
         HTTPException: If registration fails
     """
     try:
-        logger.info(f"User registration attempt: {user_data.email}")
+        logger.info("User registration attempt: %s", user_data.email)
         
         # Create user in Firebase
         result = await firebase_service.create_user(
@@ -42,43 +91,24 @@ async def register_user(user_data: UserRegister) -> AuthResponse:
             display_name=user_data.display_name
         )
         
-        logger.info(f"User registered successfully: {result['user_id']}")
+        logger.info("User registered successfully: %s", result['user_id'])
         
-        return AuthResponse(
+        return orjson_response(AuthResponse(
             user_id=result['user_id'],
             custom_token=result['custom_token'],
             user_info=result['user_info'],
             expires_in=3600
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"User registration failed: {e}")
+        logger.error("User registration failed: %s", e)
         
         # Handle specific Firebase errors
-        error_message = str(e)
-        if "email-already-exists" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Email address is already registered"
-            )
-        elif "invalid-email" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid email address format"
-            )
-        elif "weak-password" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Password is too weak"
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Registration failed. Please try again."
-            )
+        status_code, detail = _REGISTER_ERRORS.get(_firebase_error_code(e), _REGISTRATION_FAILED)
+        raise HTTPException(status_code=status_code, detail=detail) from None
 
 
-@router.post("/login", response_model=AuthResponse)
+@router.post("/login")
 async def login_user(login_data: UserLogin) -> AuthResponse:
     """
     Authenticate user and return token.
@@ -93,7 +123,7 @@ async def login_user(login_data: UserLogin) -> AuthResponse:
         HTTPException: If authentication fails
     """
     try:
-        logger.info(f"User login attempt: {login_data.email}")
+        logger.info("User login attempt: %s", login_data.email)
         
         # Authenticate user
         result = await firebase_service.authenticate_user(
@@ -101,48 +131,24 @@ async def login_user(login_data: UserLogin) -> AuthResponse:
             password=login_data.password
         )
         
-        logger.info(f"User logged in successfully: {result['user_id']}")
+        logger.info("User logged in successfully: %s", result['user_id'])
         
-        return AuthResponse(
+        return orjson_response(AuthResponse(
             user_id=result['user_id'],
             custom_token=result['custom_token'],
             user_info=result['user_info'],
             expires_in=3600
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"User login failed: {e}")
+        logger.error("User login failed: %s", e)
         
         # Handle specific Firebase errors
-        error_message = str(e)
-        if "user-not-found" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
-            )
-        elif "wrong-password" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
-            )
-        elif "user-disabled" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User account has been disabled"
-            )
-        elif "too-many-requests" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many failed login attempts. Please try again later."
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Authentication failed. Please check your credentials."
-            )
+        status_code, detail = _LOGIN_ERRORS.get(_firebase_error_code(e), _LOGIN_FAILED)
+        raise HTTPException(status_code=status_code, detail=detail) from None
 
 
-@router.get("/profile", response_model=UserProfile)
+@router.get("/profile")
 async def get_user_profile(
     request: Request,
     current_user: TokenData = Depends(get_current_user)
@@ -161,10 +167,9 @@ async def get_user_profile(
         HTTPException: If user not found or authentication fails
     """
     try:
-        logger.info(f"Getting user profile: {current_user.user_id}")
-        
         # Get user profile from Firestore
         user_profile = await firebase_service.get_user_profile(current_user.user_id)
+        logger.info("Got user profile: %s", current_user.user_id)
         
         if not user_profile:
             raise HTTPException(
@@ -172,21 +177,21 @@ async def get_user_profile(
                 detail="User profile not found"
             )
         
-        return user_profile
+        return orjson_response(user_profile)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get user profile: {e}")
+        logger.error("Failed to get user profile: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user profile"
         )
 
 
-@router.put("/profile", response_model=UserProfile)
+@router.put("/profile")
 async def update_user_profile(
-    profile_data: Dict[str, Any],
+    profile_data: ProfileUpdate,
     request: Request,
     current_user: TokenData = Depends(get_current_user)
 ) -> UserProfile:
@@ -205,17 +210,10 @@ async def update_user_profile(
         HTTPException: If update fails
     """
     try:
-        logger.info(f"Updating user profile: {current_user.user_id}")
+        logger.info("Updating user profile: %s", current_user.user_id)
         
-        # Validate allowed fields
-        allowed_fields = {
-            'display_name', 'subscription_tier'
-        }
-        
-        filtered_data = {
-            key: value for key, value in profile_data.items() 
-            if key in allowed_fields
-        }
+        # Only fields present in the request body are updated
+        filtered_data = profile_data.model_dump(exclude_unset=True)
         
         if not filtered_data:
             raise HTTPException(
@@ -223,41 +221,32 @@ async def update_user_profile(
                 detail="No valid fields to update"
             )
         
-        # Update user profile
-        success = await firebase_service.update_user_profile(
+        # Update user profile and get the merged result
+        updated_profile = await firebase_service.update_user_profile_and_get(
             current_user.user_id,
             filtered_data
         )
         
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update user profile"
-            )
-        
-        # Get updated profile
-        updated_profile = await firebase_service.get_user_profile(current_user.user_id)
-        
         if not updated_profile:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="User profile not found after update"
+                detail="User profile not found"
             )
         
-        logger.info(f"User profile updated successfully: {current_user.user_id}")
-        return updated_profile
+        logger.info("User profile updated successfully: %s", current_user.user_id)
+        return orjson_response(updated_profile)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update user profile: {e}")
+        logger.error("Failed to update user profile: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update user profile"
         )
 
 
-@router.post("/logout")
+@router.post("/logout", response_model=None)
 async def logout_user(
     request: Request,
     current_user: TokenData = Depends(get_current_user)
@@ -276,7 +265,7 @@ async def logout_user(
         HTTPException: If logout fails
     """
     try:
-        logger.info(f"User logout: {current_user.user_id}")
+        logger.info("User logout: %s", current_user.user_id)
         
         # Revoke refresh tokens
         success = await firebase_service.revoke_refresh_tokens(current_user.user_id)
@@ -287,21 +276,21 @@ async def logout_user(
                 detail="Failed to logout user"
             )
         
-        logger.info(f"User logged out successfully: {current_user.user_id}")
+        logger.info("User logged out successfully: %s", current_user.user_id)
         
         return {"message": "User logged out successfully"}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to logout user: {e}")
+        logger.error("Failed to logout user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to logout user"
         )
 
 
-@router.delete("/account")
+@router.delete("/account", response_model=None)
 async def delete_user_account(
     request: Request,
     current_user: TokenData = Depends(get_current_user)
@@ -320,7 +309,7 @@ async def delete_user_account(
         HTTPException: If deletion fails
     """
     try:
-        logger.info(f"User account deletion: {current_user.user_id}")
+        logger.info("User account deletion: %s", current_user.user_id)
         
         # Delete user from Firebase Auth and Firestore
         success = await firebase_service.delete_user(current_user.user_id)
@@ -331,21 +320,21 @@ async def delete_user_account(
                 detail="Failed to delete user account"
             )
         
-        logger.info(f"User account deleted successfully: {current_user.user_id}")
+        logger.info("User account deleted successfully: %s", current_user.user_id)
         
         return {"message": "User account deleted successfully"}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete user account: {e}")
+        logger.error("Failed to delete user account: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete user account"
         )
 
 
-@router.post("/refresh-token", response_model=AuthResponse)
+@router.post("/refresh-token")
 async def refresh_token(
     request: Request,
     current_user: TokenData = Depends(get_current_user)
@@ -364,26 +353,26 @@ async def refresh_token(
         HTTPException: If token refresh fails
     """
     try:
-        logger.info(f"Token refresh: {current_user.user_id}")
-        
-        # Create new custom token
-        import firebase_admin.auth as auth
-        custom_token = auth.create_custom_token(current_user.user_id)
+        logger.info("Token refresh: %s", current_user.user_id)
         
-        # Get user profile
-        user_profile = await firebase_service.get_user_profile(current_user.user_id)
+        # Create new custom token (blocking signer, on the Firebase pool like
+        # the service's other SDK calls) while the user profile is fetched
+        custom_token, user_profile = await asyncio.gather(
+            run_blocking(firebase_executor, create_custom_token, current_user.user_id),
+            firebase_service.get_user_profile(current_user.user_id)
+        )
         
-        logger.info(f"Token refreshed successfully: {current_user.user_id}")
+        logger.info("Token refreshed successfully: %s", current_user.user_id)
         
-        return AuthResponse(
+        return orjson_response(AuthResponse(
             user_id=current_user.user_id,
-            custom_token=custom_token.decode('utf-8'),
+            custom_token=custom_token.decode('ascii'),
             user_info=user_profile,
             expires_in=3600
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"Failed to refresh token: {e}")
+        logger.error("Failed to refresh token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to refresh authentication token"
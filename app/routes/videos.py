@@ -2,11 +2,15 @@
 Video management API routes.
 """
 
+import asyncio
+import hashlib
 import logging
-import uuid
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, Request, Query
-from fastapi.responses import JSONResponse
+from typing import AsyncIterator, Dict, Any, FrozenSet, Optional
+import orjson
+from aiolimiter import AsyncLimiter
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response, Query
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from google.cloud import firestore
 
 from app.models.video import (
     VideoUpload, VideoUploadResponse, VideoConvert, VideoConvertResponse,
@@ -17,14 +21,203 @@ from app.models.auth import TokenData
 from app.services.gcs_service import gcs_service
 from app.services.firestore_service import firestore_service
 from app.services.cloud_tasks_service import cloud_tasks_service
+from app.services.cache import cached_get_video, cached_get_job, invalidate_video
+from app.services.job_events import subscribe_job
 from app.middleware.auth_middleware import get_current_user, get_current_user_id
 from app.config import get_settings
+from app.utils.helpers import calculate_processing_time
+from app.utils.fast_uuid import fast_uuid4
+from app.utils.responses import ORJSON_OPTIONS, orjson_default
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/videos", tags=["Videos"])
+router = APIRouter(
+    prefix="/videos",
+    tags=["Videos"],
+    default_response_class=ORJSONResponse
+)
 settings = get_settings()
 
+# Upload limits read once at import; settings are immutable for the process lifetime
+_MAX_BYTES: int = settings.max_file_size_bytes
+_MAX_MB: int = settings.max_file_size_mb
+_ALLOWED_FORMATS: FrozenSet[str] = frozenset(settings.allowed_video_formats)
+
+# VR player configuration returned with every preview. Shared by all
+# responses, so it must never be mutated.
+_VR_PLAYER_CONFIG: Dict[str, Any] = {
+    "stereo_mode": "side-by-side",
+    "projection": "equirectangular",
+    "controls": True,
+    "autoplay": False,
+    "loop": False,
+    "muted": True
+}
+
+# Job statuses after which no further status events are sent
+_TERMINAL_STATUSES = frozenset({
+    VideoStatusEnum.COMPLETED.value,
+    VideoStatusEnum.FAILED.value,
+    VideoStatusEnum.CANCELLED.value
+})
+
+# Idle interval after which an SSE comment is sent to keep proxies from closing the stream
+_SSE_KEEPALIVE_SECONDS = 15
+
+# Client-side cap on Cloud Tasks enqueue rate, kept below the queue's dispatch limit
+_enqueue_limiter = AsyncLimiter(settings.cloud_tasks_max_qps, time_period=1)
+
+async def _get_owned_video(video_id: str, user_id: str, fresh: bool = False) -> VideoInfo:
+    """
+    Look up a video and verify it belongs to the given user.
+    
+    Args:
+        video_id: Video ID
+        user_id: ID of the user who must own the video
+        fresh: Read Firestore directly, bypassing the cache. Use for status
+            and readiness checks and for the blob manifest, since writes by
+            the worker or other API processes do not invalidate this
+            process's cache.
+        
+    Returns:
+        Video information
+        
+    Raises:
+        HTTPException: If video not found, access denied, or lookup fails
+    """
+    try:
+        if fresh:
+            video_info = await firestore_service.get_video_by_id(video_id)
+        else:
+            video_info = await cached_get_video(video_id)
+    except Exception as e:
+        logger.error("Failed to get video %s: %s", video_id, e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve video information"
+        )
+    
+    if not video_info:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found"
+        )
+    
+    # Verify ownership
+    if video_info.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this video"
+        )
+    
+    return video_info
+
+
+async def get_owned_video(
+    video_id: str,
+    current_user: TokenData = Depends(get_current_user)
+) -> VideoInfo:
+    """
+    Dependency resolving the path's video_id to a video owned by the current user.
+    
+    Args:
+        video_id: Video ID from the request path
+        current_user: Current authenticated user
+        
+    Returns:
+        Video information
+        
+    Raises:
+        HTTPException: If video not found, access denied, or lookup fails
+    """
+    return await _get_owned_video(video_id, current_user.user_id)
+
+
+async def get_owned_video_fresh(
+    video_id: str,
+    current_user: TokenData = Depends(get_current_user)
+) -> VideoInfo:
+    """
+    Dependency like get_owned_video, but always reading the current Firestore state.
+    
+    Args:
+        video_id: Video ID from the request path
+        current_user: Current authenticated user
+        
+    Returns:
+        Video information
+        
+    Raises:
+        HTTPException: If video not found, access denied, or lookup fails
+    """
+    return await _get_owned_video(video_id, current_user.user_id, fresh=True)
+
+
+async def _revert_queued_conversion(video_id: str, job_id: str, error: Exception) -> None:
+    """
+    Best-effort rollback of a conversion that failed while being queued.
+    
+    Puts the video back in the uploaded state so it can be resubmitted and
+    marks the job as failed. Rollback errors are logged, not raised.
+    
+    Args:
+        video_id: Video ID
+        job_id: Job ID
+        error: Error that aborted the queuing
+    """
+    results = await asyncio.gather(
+        firestore_service.update_video(video_id, {
+            'status': VideoStatusEnum.UPLOADED.value
+        }),
+        firestore_service.update_job_status(
+            job_id=job_id,
+            status=VideoStatusEnum.FAILED,
+            progress=0.0,
+            stage='Failed to queue for processing',
+            error_message=str(error)
+        ),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Failed to roll back conversion %s: %s", job_id, result)
+
+
+def _etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the fields that identify a response's state.
+    
+    Args:
+        *parts: Key fields; the ETag changes whenever any of them does
+        
+    Returns:
+        Quoted ETag value
+    """
+    key = ":".join(map(str, parts)).encode()
+    return f'"{hashlib.blake2b(key, digest_size=16).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Build a 304 response if the client's If-None-Match matches the ETag.
+    
+    Args:
+        request: FastAPI request object
+        etag: Current ETag of the resource
+        
+    Returns:
+        Empty 304 response, or None if the client needs the full body
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
 
 @router.post("/upload", response_model=VideoUploadResponse)
 async def upload_video(
@@ -47,33 +240,24 @@ async def upload_video(
         HTTPException: If upload preparation fails
     """
     try:
-        logger.info(f"Video upload request: {upload_data.filename} by {current_user.user_id}")
+        logger.info("Video upload request: %s by %s", upload_data.filename, current_user.user_id)
         
         # Validate file size
-        if upload_data.file_size > settings.max_file_size_bytes:
+        if upload_data.file_size > _MAX_BYTES:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File size exceeds maximum limit of {settings.max_file_size_mb}MB"
+                detail=f"File size exceeds maximum limit of {_MAX_MB}MB"
             )
         
         # Validate content type
-        if upload_data.content_type not in settings.allowed_video_formats:
+        if upload_data.content_type not in _ALLOWED_FORMATS:
             raise HTTPException(
                 status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
                 detail=f"Unsupported video format: {upload_data.content_type}"
             )
         
         # Generate unique video ID
-        video_id = str(uuid.uuid4())
-        
-        # Generate signed upload URL
-        upload_result = await gcs_service.generate_signed_upload_url(
-            user_id=current_user.user_id,
-            video_id=video_id,
-            filename=upload_data.filename,
-            content_type=upload_data.content_type,
-            expiration_minutes=60
-        )
+        video_id = fast_uuid4()
         
         # Create video record in Firestore
         video_data = {
@@ -84,18 +268,31 @@ async def upload_video(
             'filename': upload_data.filename,
             'content_type': upload_data.content_type,
             'file_size': upload_data.file_size,
-            'status': VideoStatusEnum.UPLOADING,
+            'status': VideoStatusEnum.UPLOADING.value,
             'original_url': None,
             'converted_url': None,
             'thumbnail_url': None,
-            'preview_url': None
+            'preview_url': None,
+            'blob_paths': gcs_service.get_upload_blob_paths(
+                current_user.user_id, video_id, upload_data.filename
+            )
         }
         
-        await firestore_service.create_video_record(video_data)
+        # Signing the upload URL and creating the record are independent
+        upload_result, _ = await asyncio.gather(
+            gcs_service.generate_signed_upload_url(
+                user_id=current_user.user_id,
+                video_id=video_id,
+                filename=upload_data.filename,
+                content_type=upload_data.content_type,
+                expiration_minutes=60
+            ),
+            firestore_service.create_video_record(video_data)
+        )
         
-        logger.info(f"Upload URL generated for video: {video_id}")
+        logger.info("Upload URL generated for video: %s", video_id)
         
-        return VideoUploadResponse(
+        return VideoUploadResponse.model_construct(
             video_id=video_id,
             signed_upload_url=upload_result['signed_upload_url'],
             upload_metadata=upload_result['upload_metadata'],
@@ -105,7 +302,7 @@ async def upload_video(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Video upload preparation failed: {e}")
+        logger.error("Video upload preparation failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to prepare video upload"
@@ -133,23 +330,11 @@ async def convert_video(
         HTTPException: If conversion queuing fails
     """
     try:
-        logger.info(f"Video conversion request: {convert_data.video_id} by {current_user.user_id}")
-        
-        # Get video information
-        video_info = await firestore_service.get_video_by_id(convert_data.video_id)
-        
-        if not video_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
+        logger.info("Video conversion request: %s by %s", convert_data.video_id, current_user.user_id)
         
-        # Verify ownership
-        if video_info.user_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied to this video"
-            )
+        # Get video information and verify ownership (uncached: the upload
+        # completion that makes it convertible is written elsewhere)
+        video_info = await _get_owned_video(convert_data.video_id, current_user.user_id, fresh=True)
         
         # Check if video is ready for conversion
         if video_info.status != VideoStatusEnum.UPLOADED:
@@ -159,54 +344,75 @@ async def convert_video(
             )
         
         # Generate unique job ID
-        job_id = str(uuid.uuid4())
+        job_id = fast_uuid4()
+        
+        # Serialize settings once for both the job record and the task payload
+        conversion_settings = convert_data.conversion_settings.model_dump(mode="json")
         
         # Create job record in Firestore
         job_data = {
             'job_id': job_id,
             'video_id': convert_data.video_id,
             'user_id': current_user.user_id,
-            'status': VideoStatusEnum.QUEUED,
+            'status': VideoStatusEnum.QUEUED.value,
             'progress_percentage': 0.0,
             'stage': 'Queued for processing',
             'eta_minutes': None,
             'error_message': None,
-            'conversion_settings': convert_data.conversion_settings.dict()
+            'conversion_settings': conversion_settings
         }
         
-        await firestore_service.create_job_record(job_data)
-        
-        # Update video status
-        await firestore_service.update_video(convert_data.video_id, {
-            'status': VideoStatusEnum.QUEUED
-        })
-        
-        # Create Cloud Tasks job
-        task_name = await cloud_tasks_service.create_video_conversion_task(
-            video_id=convert_data.video_id,
-            user_id=current_user.user_id,
-            job_id=job_id,
-            conversion_settings=convert_data.conversion_settings.dict(),
-            priority=convert_data.priority
-        )
+        try:
+            # The job record and video status writes are independent
+            for result in await asyncio.gather(
+                firestore_service.create_job_record(job_data),
+                firestore_service.update_video(convert_data.video_id, {
+                    'status': VideoStatusEnum.QUEUED.value,
+                    'blob_paths': firestore.ArrayUnion(gcs_service.get_conversion_blob_paths(
+                        current_user.user_id, convert_data.video_id, video_info.filename
+                    ))
+                }),
+                return_exceptions=True
+            ):
+                if isinstance(result, Exception):
+                    raise result
+            
+            # Create Cloud Tasks job once both records are written
+            async with _enqueue_limiter:
+                task_name = await cloud_tasks_service.create_video_conversion_task(
+                    video_id=convert_data.video_id,
+                    user_id=current_user.user_id,
+                    job_id=job_id,
+                    conversion_settings=conversion_settings,
+                    priority=convert_data.priority
+                )
+        except Exception as e:
+            await _revert_queued_conversion(convert_data.video_id, job_id, e)
+            raise
+        finally:
+            invalidate_video(convert_data.video_id)
         
         # Estimate processing time based on video size and settings
-        estimated_time = _estimate_processing_time(video_info.file_size, convert_data.conversion_settings)
+        estimated_time = calculate_processing_time(
+            video_info.file_size,
+            resolution=convert_data.conversion_settings.resolution,
+            quality=convert_data.conversion_settings.quality
+        )
         
-        logger.info(f"Video conversion queued: {job_id}")
+        logger.info("Video conversion queued: %s", job_id)
         
-        return VideoConvertResponse(
+        return VideoConvertResponse.model_construct(
             job_id=job_id,
             video_id=convert_data.video_id,
             estimated_time_minutes=estimated_time,
-            status=VideoStatusEnum.QUEUED,
+            status=VideoStatusEnum.QUEUED.value,
             queue_position=1  # TODO: Implement actual queue position
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Video conversion queuing failed: {e}")
+        logger.error("Video conversion queuing failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to queue video conversion"
@@ -217,14 +423,20 @@ async def convert_video(
 async def get_conversion_status(
     job_id: str,
     request: Request,
+    response: Response,
     current_user: TokenData = Depends(get_current_user)
 ) -> VideoStatus:
     """
     Get video conversion job status.
     
+    Supports conditional GET: pollers sending the last ETag in
+    If-None-Match get an empty 304 until the job advances. Clients that
+    can hold a connection open should prefer /status/stream/{job_id}.
+    
     Args:
         job_id: Job ID
         request: FastAPI request object
+        response: Outgoing response, used to set the ETag header
         current_user: Current authenticated user
         
     Returns:
@@ -234,10 +446,10 @@ async def get_conversion_status(
         HTTPException: If job not found or access denied
     """
     try:
-        logger.info(f"Status request for job: {job_id}")
+        logger.info("Status request for job: %s", job_id)
         
         # Get job status
-        job_status = await firestore_service.get_job_by_id(job_id)
+        job_status = await cached_get_job(job_id)
         
         if not job_status:
             raise HTTPException(
@@ -252,31 +464,173 @@ async def get_conversion_status(
                 detail="Access denied to this job"
             )
         
+        etag = _etag(
+            job_id, job_status.status, job_status.progress_percentage,
+            job_status.stage, job_status.eta_minutes, job_status.error_message,
+            job_status.completed_at
+        )
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        response.headers["ETag"] = etag
         return job_status
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get job status: {e}")
+        logger.error("Failed to get job status: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve job status"
+        )
+
+
+@router.get("/status/stream/{job_id}")
+async def stream_conversion_status(
+    job_id: str,
+    request: Request,
+    current_user: TokenData = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Push job status changes as Server-Sent Events.
+    
+    Each change of the job document is sent as one ``data:`` event with the
+    job's VideoStatus JSON (``null`` once the job is deleted). The stream ends after a terminal status (completed, failed,
+    cancelled) or if the job is deleted. All subscribers to a job share one
+    Firestore listener.
+    
+    Args:
+        job_id: Job ID
+        request: FastAPI request object
+        current_user: Current authenticated user
+        
+    Returns:
+        Streaming text/event-stream response
+        
+    Raises:
+        HTTPException: If job not found or access denied
+    """
+    logger.info("Status stream request for job: %s", job_id)
+    
+    try:
+        job_status = await cached_get_job(job_id)
+    except Exception as e:
+        logger.error("Failed to get job status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve job status"
         )
+    
+    if not job_status:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    # Verify ownership
+    if job_status.user_id != current_user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this job"
+        )
+    
+    async def _events() -> AsyncIterator[bytes]:
+        async with subscribe_job(job_id) as updates:
+            while True:
+                try:
+                    job = await asyncio.wait_for(updates.get(), _SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                
+                if job is None:
+                    yield b"data: null\n\n"
+                    return
+                
+                # Same fields and formatting as /status/{job_id}; the raw
+                # document would also expose internal fields
+                job_status = VideoStatus(**{**job, 'job_id': job_id})
+                yield b"data: " + orjson.dumps(job_status.model_dump(mode="json")) + b"\n\n"
+                
+                if job_status.status in _TERMINAL_STATUSES:
+                    return
+    
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/stream")
+async def stream_user_videos(
+    request: Request,
+    current_user: TokenData = Depends(get_current_user),
+    page_size: int = Query(100, ge=1, le=100, description="Videos fetched per Firestore page")
+) -> StreamingResponse:
+    """
+    Stream all of the current user's videos as NDJSON, one video per line.
+    
+    Pages are fetched from Firestore as the response is written, so the
+    client can parse rows incrementally and only one page is held in memory.
+    
+    Args:
+        request: FastAPI request object
+        current_user: Current authenticated user
+        page_size: Videos fetched per Firestore page
+        
+    Returns:
+        Streaming NDJSON response
+    """
+    logger.info("User videos stream request: %s", current_user.user_id)
+    
+    async def _rows() -> AsyncIterator[bytes]:
+        page = 1
+        while True:
+            try:
+                result = await firestore_service.get_user_videos(
+                    user_id=current_user.user_id,
+                    page=page,
+                    page_size=page_size
+                )
+            except Exception as e:
+                # Headers are already sent; end the stream early
+                logger.error("Failed to stream user videos: %s", e)
+                return
+            
+            for video in result['videos']:
+                row = video.model_dump(mode="python") if isinstance(video, VideoInfo) else video
+                yield orjson.dumps(
+                    row, default=orjson_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+                )
+            
+            if not result['has_next']:
+                return
+            page += 1
+    
+    return StreamingResponse(_rows(), media_type="application/x-ndjson")
 
 
 @router.get("/{video_id}", response_model=VideoInfo)
 async def get_video_info(
     video_id: str,
     request: Request,
-    current_user: TokenData = Depends(get_current_user)
+    response: Response,
+    current_user: TokenData = Depends(get_current_user),
+    video_info: VideoInfo = Depends(get_owned_video)
 ) -> VideoInfo:
     """
     Get video information and metadata.
     
+    Supports conditional GET via ETag / If-None-Match.
+    
     Args:
         video_id: Video ID
         request: FastAPI request object
+        response: Outgoing response, used to set the ETag header
         current_user: Current authenticated user
+        video_info: Video owned by the current user
         
     Returns:
         Video information
@@ -284,35 +638,15 @@ async def get_video_info(
     Raises:
         HTTPException: If video not found or access denied
     """
-    try:
-        logger.info(f"Video info request: {video_id}")
-        
-        # Get video information
-        video_info = await firestore_service.get_video_by_id(video_id)
-        
-        if not video_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        # Verify ownership
-        if video_info.user_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied to this video"
-            )
-        
-        return video_info
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get video info: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve video information"
-        )
+    logger.info("Video info request: %s", video_id)
+    
+    etag = _etag(video_id, video_info.updated_at, video_info.status)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    response.headers["ETag"] = etag
+    return video_info
 
 
 @router.get("/download/{video_id}", response_model=VideoDownload)
@@ -320,6 +654,7 @@ async def get_download_url(
     video_id: str,
     request: Request,
     current_user: TokenData = Depends(get_current_user),
+    video_info: VideoInfo = Depends(get_owned_video_fresh),
     format_type: str = Query("original", description="Download format: original or vr180")
 ) -> VideoDownload:
     """
@@ -330,6 +665,7 @@ async def get_download_url(
         format_type: Download format (original or vr180)
         request: FastAPI request object
         current_user: Current authenticated user
+        video_info: Video owned by the current user
         
     Returns:
         Signed download URL and metadata
@@ -338,23 +674,7 @@ async def get_download_url(
         HTTPException: If video not found or access denied
     """
     try:
-        logger.info(f"Download request: {video_id} ({format_type})")
-        
-        # Get video information
-        video_info = await firestore_service.get_video_by_id(video_id)
-        
-        if not video_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        # Verify ownership
-        if video_info.user_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied to this video"
-            )
+        logger.info("Download request: %s (%s)", video_id, format_type)
         
         # Determine filename based on format
         if format_type == "vr180":
@@ -375,7 +695,7 @@ async def get_download_url(
             expiration_minutes=60
         )
         
-        return VideoDownload(
+        return VideoDownload.model_construct(
             download_url=download_result['download_url'],
             filename=download_result['filename'],
             content_type=download_result['content_type'],
@@ -386,7 +706,7 @@ async def get_download_url(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to generate download URL: {e}")
+        logger.error("Failed to generate download URL: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate download URL"
@@ -397,7 +717,8 @@ async def get_download_url(
 async def get_preview_url(
     video_id: str,
     request: Request,
-    current_user: TokenData = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_user),
+    video_info: VideoInfo = Depends(get_owned_video_fresh)
 ) -> VideoPreview:
     """
     Get VR preview URLs for video.
@@ -406,6 +727,7 @@ async def get_preview_url(
         video_id: Video ID
         request: FastAPI request object
         current_user: Current authenticated user
+        video_info: Video owned by the current user
         
     Returns:
         Preview URLs and VR player configuration
@@ -414,23 +736,7 @@ async def get_preview_url(
         HTTPException: If video not found or access denied
     """
     try:
-        logger.info(f"Preview request: {video_id}")
-        
-        # Get video information
-        video_info = await firestore_service.get_video_by_id(video_id)
-        
-        if not video_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        # Verify ownership
-        if video_info.user_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied to this video"
-            )
+        logger.info("Preview request: %s", video_id)
         
         # Check if VR 180° version is available
         if not video_info.converted_url:
@@ -439,29 +745,20 @@ async def get_preview_url(
                 detail="VR 180° version not available for preview"
             )
         
-        # Generate preview URLs
-        preview_url = await gcs_service.generate_public_url(
-            user_id=current_user.user_id,
-            video_id=video_id,
-            filename=f"converted_vr180_{video_info.filename}"
-        )
-        
-        thumbnail_url = await gcs_service.generate_public_url(
-            user_id=current_user.user_id,
-            video_id=video_id,
-            filename="thumbnail.jpg"
+        # Generate preview URLs concurrently
+        preview_url, thumbnail_url = await asyncio.gather(
+            gcs_service.generate_public_url(
+                user_id=current_user.user_id,
+                video_id=video_id,
+                filename=f"converted_vr180_{video_info.filename}"
+            ),
+            gcs_service.generate_public_url(
+                user_id=current_user.user_id,
+                video_id=video_id,
+                filename="thumbnail.jpg"
+            )
         )
         
-        # VR player configuration
-        vr_player_config = {
-            "stereo_mode": "side-by-side",
-            "projection": "equirectangular",
-            "controls": True,
-            "autoplay": False,
-            "loop": False,
-            "muted": True
-        }
-        
         # Preview metadata
         metadata = {
             "title": video_info.title or video_info.filename,
@@ -470,17 +767,17 @@ async def get_preview_url(
             "frame_rate": video_info.frame_rate
         }
         
-        return VideoPreview(
+        return VideoPreview.model_construct(
             preview_url=preview_url,
             thumbnail_url=thumbnail_url,
             metadata=metadata,
-            vr_player_config=vr_player_config
+            vr_player_config=_VR_PLAYER_CONFIG
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to generate preview URLs: {e}")
+        logger.error("Failed to generate preview URLs: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate preview URLs"
@@ -491,6 +788,7 @@ async def get_preview_url(
 async def get_user_videos(
     user_id: str,
     request: Request,
+    response: Response,
     current_user: TokenData = Depends(get_current_user),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Videos per page")
@@ -498,11 +796,14 @@ async def get_user_videos(
     """
     Get paginated list of user's videos.
     
+    Supports conditional GET via ETag / If-None-Match.
+    
     Args:
         user_id: User ID
         page: Page number
         page_size: Videos per page
         request: FastAPI request object
+        response: Outgoing response, used to set the ETag header
         current_user: Current authenticated user
         
     Returns:
@@ -512,7 +813,7 @@ async def get_user_videos(
         HTTPException: If access denied or retrieval fails
     """
     try:
-        logger.info(f"User videos request: {user_id} (page {page})")
+        logger.info("User videos request: %s (page %s)", user_id, page)
         
         # Verify access (users can only access their own videos)
         if user_id != current_user.user_id:
@@ -528,7 +829,7 @@ async def get_user_videos(
             page_size=page_size
         )
         
-        return VideoList(
+        video_list = VideoList(
             videos=result['videos'],
             total_count=result['total_count'],
             page=result['page'],
@@ -536,10 +837,21 @@ async def get_user_videos(
             has_next=result['has_next']
         )
         
+        etag = _etag(
+            user_id, video_list.page, video_list.page_size, video_list.total_count,
+            *(f"{v.video_id}@{v.updated_at}@{v.status}" for v in video_list.videos)
+        )
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        response.headers["ETag"] = etag
+        return video_list
+        
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get user videos: {e}")
+        logger.error("Failed to get user videos: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user videos"
@@ -550,15 +862,20 @@ async def get_user_videos(
 async def delete_video(
     video_id: str,
     request: Request,
-    current_user: TokenData = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_user),
+    video_info: VideoInfo = Depends(get_owned_video_fresh)
 ) -> Dict[str, str]:
     """
     Delete video and all associated files.
     
+    The blob manifest is read from Firestore at delete time; a cached copy
+    may predate conversion outputs recorded by another worker.
+    
     Args:
         video_id: Video ID
         request: FastAPI request object
         current_user: Current authenticated user
+        video_info: Video owned by the current user
         
     Returns:
         Deletion confirmation message
@@ -567,81 +884,26 @@ async def delete_video(
         HTTPException: If video not found or access denied
     """
     try:
-        logger.info(f"Video deletion request: {video_id}")
-        
-        # Get video information
-        video_info = await firestore_service.get_video_by_id(video_id)
-        
-        if not video_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Video not found"
-            )
-        
-        # Verify ownership
-        if video_info.user_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied to this video"
-            )
+        logger.info("Video deletion request: %s", video_id)
         
         # Delete files from GCS
-        await gcs_service.delete_video_files(current_user.user_id, video_id)
+        await gcs_service.delete_video_files(
+            current_user.user_id, video_id, blob_paths=video_info.blob_paths
+        )
+        invalidate_video(video_id)
         
         # Delete video record from Firestore
         # TODO: Implement video deletion in Firestore service
         
-        logger.info(f"Video deleted successfully: {video_id}")
+        logger.info("Video deleted successfully: %s", video_id)
         
         return {"message": "Video deleted successfully"}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete video: {e}")
+        logger.error("Failed to delete video: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete video"
         )
-
-
-def _estimate_processing_time(file_size: int, settings: ConversionSettings) -> int:
-    """
-    Estimate video processing time based on file size and settings.
-    
-    Args:
-        file_size: File size in bytes
-        settings: Conversion settings
-        
-    Returns:
-        Estimated processing time in minutes
-    """
-    # Base processing time in minutes per GB
-    base_time_per_gb = 5
-    
-    # Quality multiplier
-    quality_multipliers = {
-        "low": 0.5,
-        "medium": 1.0,
-        "high": 1.5,
-        "ultra": 2.0
-    }
-    
-    # Resolution multiplier
-    resolution_multipliers = {
-        "720p": 0.5,
-        "1080p": 1.0,
-        "1440p": 1.5,
-        "4K": 2.5
-    }
-    
-    # Calculate estimated time
-    file_size_gb = file_size / (1024 ** 3)
-    base_time = file_size_gb * base_time_per_gb
-    quality_multiplier = quality_multipliers.get(settings.quality, 1.0)
-    resolution_multiplier = resolution_multipliers.get(settings.resolution, 1.0)
-    
-    estimated_time = int(base_time * quality_multiplier * resolution_multiplier)
-    
-    # Minimum processing time
-    return max(estimated_time, 2)
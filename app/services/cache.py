@@ -0,0 +1,132 @@
+"""
+In-process TTL caches for Firestore video and job lookups.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from cachetools import TTLCache
+
+from app.config import get_settings
+from app.models.video import VideoInfo, VideoStatus
+from app.services.firestore_service import firestore_service
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Both videos and jobs are also written outside this process (upload
+# completion and conversion progress come from the worker), and those writes
+# do not invalidate these caches; entries can lag by up to their TTL. Routes
+# that gate on video status (convert, download, preview) read Firestore
+# directly, and conversion status polls get a short job TTL.
+_video_cache: TTLCache = TTLCache(
+    maxsize=settings.cache_max_entries, ttl=settings.video_cache_ttl_seconds
+)
+_job_cache: TTLCache = TTLCache(
+    maxsize=settings.cache_max_entries, ttl=settings.job_cache_ttl_seconds
+)
+
+# Lookups currently being fetched, so concurrent misses share one read
+_inflight_videos: Dict[str, asyncio.Task] = {}
+_inflight_jobs: Dict[str, asyncio.Task] = {}
+
+
+async def _get_or_fetch(
+    cache: TTLCache,
+    inflight: Dict[str, asyncio.Task],
+    key: str,
+    fetch: Callable[[str], Awaitable[Any]]
+) -> Any:
+    """
+    Return a cached value, joining or starting a single fetch on a miss.
+    
+    The fetch runs as its own task, so a caller being cancelled does not
+    cancel the read for the other waiters. Its result is cached only if
+    the key was not invalidated while the fetch was in flight.
+    
+    Args:
+        cache: Cache to read and populate
+        inflight: In-flight fetches for this cache, keyed like the cache
+        key: Cache key
+        fetch: Coroutine function performing the uncached read
+    
+    Returns:
+        The cached or fetched value (None if not found)
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch(key))
+        inflight[key] = task
+        
+        def _on_done(done: asyncio.Task) -> None:
+            if inflight.get(key) is not done:
+                return
+            del inflight[key]
+            if not done.cancelled() and done.exception() is None and done.result() is not None:
+                cache[key] = done.result()
+        
+        task.add_done_callback(_on_done)
+    
+    return await asyncio.shield(task)
+
+
+async def cached_get_video(video_id: str) -> Optional[VideoInfo]:
+    """
+    Get a video by ID, served from the TTL cache when possible.
+    
+    Args:
+        video_id: Video ID
+    
+    Returns:
+        VideoInfo object or None if not found
+    """
+    if not settings.cache_enabled:
+        return await firestore_service.get_video_by_id(video_id)
+    return await _get_or_fetch(
+        _video_cache, _inflight_videos, video_id, firestore_service.get_video_by_id
+    )
+
+
+async def cached_get_job(job_id: str) -> Optional[VideoStatus]:
+    """
+    Get a job by ID, served from the TTL cache when possible.
+    
+    Args:
+        job_id: Job ID
+    
+    Returns:
+        Job status object or None if not found
+    """
+    if not settings.cache_enabled:
+        return await firestore_service.get_job_by_id(job_id)
+    return await _get_or_fetch(
+        _job_cache, _inflight_jobs, job_id, firestore_service.get_job_by_id
+    )
+
+
+def invalidate_video(video_id: str) -> None:
+    """
+    Drop a cached video and detach any in-flight read of it.
+    
+    Args:
+        video_id: Video ID
+    """
+    _video_cache.pop(video_id, None)
+    _inflight_videos.pop(video_id, None)
+
+
+def invalidate_job(job_id: str) -> None:
+    """
+    Drop a cached job and detach any in-flight read of it.
+    
+    Args:
+        job_id: Job ID
+    """
+    _job_cache.pop(job_id, None)
+    _inflight_jobs.pop(job_id, None)
@@ -0,0 +1,75 @@
+"""
+Process-wide Google Cloud clients shared by every service.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from google.cloud import firestore, storage
+from google.oauth2 import service_account
+
+from app.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_firestore_client() -> firestore.Client:
+    """
+    Get the shared Firestore client (created once per process).
+    
+    The client keeps its own gRPC connection pool and is safe to call
+    concurrently, so one instance serves every collection.
+    
+    Returns:
+        Firestore client
+    """
+    return firestore.Client(project=get_settings().firebase_project_id)
+
+
+@lru_cache(maxsize=1)
+def get_storage_client() -> storage.Client:
+    """
+    Get the shared Cloud Storage client (created once per process).
+    
+    Returns:
+        Cloud Storage client
+        
+    Raises:
+        DefaultCredentialsError: If no credentials are available; the
+            failure is not cached, so a later call retries
+    """
+    return storage.Client(project=get_settings().google_cloud_project_id)
+
+
+@lru_cache(maxsize=1)
+def get_service_account_info() -> Optional[Dict[str, Any]]:
+    """
+    Get the service-account key configured as inline JSON (parsed once).
+    
+    Returns:
+        Parsed key, or None if no inline key is configured
+    """
+    key_json = get_settings().firebase_service_account_key_json
+    return json.loads(key_json) if key_json else None
+
+
+@lru_cache(maxsize=1)
+def get_signing_credentials() -> Optional[service_account.Credentials]:
+    """
+    Get service-account credentials for signing URLs locally (loaded once).
+    
+    Uses the configured service-account key. With a private key at hand,
+    V4 URL signing is a local RSA signature instead of an IAM signBlob call.
+    
+    Returns:
+        Service-account credentials, or None if no key is configured
+    """
+    settings = get_settings()
+    info = get_service_account_info()
+    if info is not None:
+        return service_account.Credentials.from_service_account_info(info)
+    if settings.firebase_service_account_key_path:
+        return service_account.Credentials.from_service_account_file(
+            settings.firebase_service_account_key_path
+        )
+    return None
@@ -0,0 +1,93 @@
+"""
+Dedicated pools for blocking Google Cloud SDK calls, video I/O, inference and
+CPU-bound work.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.config import get_settings
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+# Kept separate from the loop's default executor so a burst of storage
+# calls cannot starve other asyncio.to_thread users (and vice versa)
+gcs_executor = ThreadPoolExecutor(
+    max_workers=settings.gcs_pool_size, thread_name_prefix="gcs"
+)
+firebase_executor = ThreadPoolExecutor(
+    max_workers=settings.firebase_pool_size, thread_name_prefix="firebase"
+)
+
+# FFmpeg pipe reads and writes and process waits during conversions; each
+# running conversion holds a reader and a writer thread
+media_executor = ThreadPoolExecutor(
+    max_workers=settings.media_pool_size, thread_name_prefix="media"
+)
+
+# Model loading and inference on a single thread: CUDA stream contexts are
+# per thread, and compiled graphs / CUDA graph replays stay on one thread
+inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+
+# Process pool for numpy work that holds the GIL (stereo generation on
+# CPU-only workers). Created on first use, so API processes that never run
+# a CPU conversion don't own one.
+_cpu_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_cpu_executor() -> ProcessPoolExecutor:
+    """
+    Return the process pool for CPU-bound work, creating it on first use.
+    
+    Workers are started from a forkserver rather than forked from this
+    process: by then it runs gRPC and thread-pool threads, which are not
+    fork-safe.
+    
+    Returns:
+        Process pool with one worker per core
+    """
+    global _cpu_executor
+    if _cpu_executor is None:
+        _cpu_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _cpu_executor
+
+
+async def run_blocking(
+    executor: Executor,
+    fn: Callable[..., T],
+    *args: Any,
+    **kwargs: Any
+) -> T:
+    """
+    Run a blocking call on the given executor without blocking the event loop.
+    
+    Args:
+        executor: Pool to run the call on
+        fn: Blocking callable
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+        
+    Returns:
+        The callable's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+
+def shutdown_executors() -> None:
+    """Stop accepting work on the dedicated pools (in-flight calls finish)."""
+    gcs_executor.shutdown(wait=False)
+    firebase_executor.shutdown(wait=False)
+    media_executor.shutdown(wait=False)
+    inference_executor.shutdown(wait=False)
+    if _cpu_executor is not None:
+        _cpu_executor.shutdown(wait=False)
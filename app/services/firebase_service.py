@@ -2,20 +2,71 @@
 Firebase Admin SDK integration for authentication and user management.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
+import time
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
 import firebase_admin
+from cachetools import TTLCache
 from firebase_admin import auth, credentials
+from google.api_core.exceptions import Aborted
 from google.cloud import firestore
 
 from app.config import get_settings
+from app.services.clients import get_firestore_client, get_service_account_info
+from app.services.executors import firebase_executor, run_blocking
 from app.models.auth import UserProfile, TokenData
+from app.utils.helpers import chunk_iter, chunk_list
 
 logger = logging.getLogger(__name__)
 
+# Profiles change rarely; a short TTL keeps reads fresh enough
+_PROFILE_CACHE_SIZE = 10_000
+_PROFILE_CACHE_TTL_SECONDS = 30
+
+# Maximum number of writes Firestore accepts in one batch
+_FIRESTORE_BATCH_LIMIT = 500
+
+# How often the ID-token signing keys are re-fetched in the background; the
+# verifier's HTTP cache honours the keys' max-age, so fresh keys cost nothing
+_PUBLIC_KEY_REFRESH_SECONDS = 30 * 60
+
+# last_login writes are coalesced and flushed in batches at most this often
+_LOGIN_FLUSH_SECONDS = 1.0
+_LOGIN_COMMIT_ATTEMPTS = 3
+
+
+@lru_cache(maxsize=1)
+def _load_credential() -> Optional[credentials.Base]:
+    """
+    Load the Firebase Admin credential (parsed and derived once per process).
+    
+    Returns:
+        Credential, or None if none is available
+    """
+    settings = get_settings()
+    
+    # Try to get service account key from JSON string first
+    service_account_info = get_service_account_info()
+    if service_account_info is not None:
+        return credentials.Certificate(service_account_info)
+    
+    # Fall back to file path
+    if settings.firebase_service_account_key_path:
+        return credentials.Certificate(settings.firebase_service_account_key_path)
+    
+    # Use default credentials (for Cloud Run deployment)
+    try:
+        return credentials.ApplicationDefault()
+    except Exception:
+        # For testing, create a dummy credential
+        logger.warning("No Firebase credentials found. Using dummy credentials for testing.")
+        return None
+
 
 class FirebaseService:
     """Firebase service for authentication and user management."""
@@ -24,32 +75,24 @@ class FirebaseService:
         """Initialize Firebase service."""
         self.settings = get_settings()
         self._initialize_firebase()
-        self._db = None
+        self._profile_cache: TTLCache = TTLCache(
+            maxsize=_PROFILE_CACHE_SIZE, ttl=_PROFILE_CACHE_TTL_SECONDS
+        )
+        self._profile_locks: Dict[str, asyncio.Lock] = {}
+        # Verified tokens keyed by SHA-256 of the raw token: digest -> (monotonic expiry, TokenData)
+        self._token_cache: TTLCache = TTLCache(
+            maxsize=self.settings.token_cache_size, ttl=self.settings.token_cache_ttl
+        )
+        # Logins awaiting their last_login write: user ID -> latest login time
+        self._pending_logins: Dict[str, datetime] = {}
+        self._login_flusher: Optional[asyncio.Task] = None
+        self._login_batch_full: Optional[asyncio.Event] = None
     
     def _initialize_firebase(self) -> None:
         """Initialize Firebase Admin SDK."""
         try:
             if not firebase_admin._apps:
-                # Try to get service account key from JSON string first
-                if self.settings.firebase_service_account_key_json:
-                    service_account_info = json.loads(
-                        self.settings.firebase_service_account_key_json
-                    )
-                    cred = credentials.Certificate(service_account_info)
-                # Fall back to file path
-                elif self.settings.firebase_service_account_key_path:
-                    cred = credentials.Certificate(
-                        self.settings.firebase_service_account_key_path
-                    )
-                else:
-                    # Use default credentials (for Cloud Run deployment)
-                    try:
-                        cred = credentials.ApplicationDefault()
-                    except Exception:
-                        # For testing, create a dummy credential
-                        logger.warning("No Firebase credentials found. Using dummy credentials for testing.")
-                        cred = None
-                
+                cred = _load_credential()
                 if cred:
                     firebase_admin.initialize_app(cred, {
                         'projectId': self.settings.firebase_project_id
@@ -63,12 +106,39 @@ class FirebaseService:
         except Exception as e:
             logger.warning(f"Failed to initialize Firebase: {e}. Service will be limited.")
     
+    def _fetch_public_keys(self) -> None:
+        """
+        Fetch the ID-token signing certificates into the verifier's cache (blocking).
+        
+        The Admin SDK downloads these on the first verify_id_token call and
+        whenever its cached copy expires; fetching them here keeps that
+        download off the request path.
+        """
+        verifier = auth._get_client(None)._token_verifier
+        verifier.request(verifier.id_token_verifier.cert_url)
+    
+    async def refresh_public_keys_forever(self) -> None:
+        """
+        Warm the ID-token public keys now and keep them fresh.
+        
+        Runs until cancelled. Does nothing if Firebase is not initialized.
+        """
+        if not firebase_admin._apps:
+            logger.warning("Firebase not initialized; skipping public key refresh")
+            return
+        
+        while True:
+            try:
+                await run_blocking(firebase_executor, self._fetch_public_keys)
+                logger.debug("Firebase public keys refreshed")
+            except Exception as e:
+                logger.warning(f"Failed to refresh Firebase public keys: {e}")
+            await asyncio.sleep(_PUBLIC_KEY_REFRESH_SECONDS)
+    
     @property
     def db(self) -> firestore.Client:
         """Get Firestore database client."""
-        if self._db is None:
-            self._db = firestore.Client(project=self.settings.firebase_project_id)
-        return self._db
+        return get_firestore_client()
     
     async def create_user(
         self, 
@@ -92,7 +162,9 @@ class FirebaseService:
         """
         try:
             # Create user in Firebase Auth
-            user_record = auth.create_user(
+            user_record = await run_blocking(
+                firebase_executor,
+                auth.create_user,
                 email=email,
                 password=password,
                 display_name=display_name,
@@ -100,7 +172,9 @@ class FirebaseService:
             )
             
             # Create custom token
-            custom_token = auth.create_custom_token(user_record.uid)
+            custom_token = await run_blocking(
+                firebase_executor, auth.create_custom_token, user_record.uid
+            )
             
             # Create user profile in Firestore
             user_profile = {
@@ -116,13 +190,17 @@ class FirebaseService:
             }
             
             # Store user profile in Firestore
-            self.db.collection('users').document(user_record.uid).set(user_profile)
+            await run_blocking(
+                firebase_executor, 
+                self.db.collection('users').document(user_record.uid).set, 
+                user_profile
+            )
             
             logger.info(f"User created successfully: {user_record.uid}")
             
             return {
                 'user_id': user_record.uid,
-                'custom_token': custom_token.decode('utf-8'),
+                'custom_token': custom_token.decode('ascii'),
                 'user_info': user_profile
             }
             
@@ -146,25 +224,26 @@ class FirebaseService:
         """
         try:
             # Get user by email
-            user_record = auth.get_user_by_email(email)
-            
-            # Create custom token
-            custom_token = auth.create_custom_token(user_record.uid)
+            user_record = await run_blocking(firebase_executor, auth.get_user_by_email, email)
             
-            # Update last login timestamp
-            self.db.collection('users').document(user_record.uid).update({
-                'last_login': datetime.utcnow()
-            })
+            # Create custom token and read the profile concurrently
+            login_at = datetime.utcnow()
+            custom_token, profile = await asyncio.gather(
+                run_blocking(firebase_executor, auth.create_custom_token, user_record.uid),
+                self.get_user_profile(user_record.uid)
+            )
             
-            # Get user profile
-            user_doc = self.db.collection('users').document(user_record.uid).get()
-            user_profile = user_doc.to_dict() if user_doc.exists else None
+            # The last_login write is queued and committed with other logins
+            user_profile = None
+            if profile is not None:
+                user_profile = {**profile.model_dump(), 'last_login': login_at}
+                self._queue_login(user_record.uid, login_at)
             
             logger.info(f"User authenticated successfully: {user_record.uid}")
             
             return {
                 'user_id': user_record.uid,
-                'custom_token': custom_token.decode('utf-8'),
+                'custom_token': custom_token.decode('ascii'),
                 'user_info': user_profile
             }
             
@@ -172,10 +251,76 @@ class FirebaseService:
             logger.error(f"Failed to authenticate user: {e}")
             raise
     
+    def _queue_login(self, user_id: str, login_at: datetime) -> None:
+        """
+        Queue a last_login update, starting a delayed flush if none is pending.
+        
+        Args:
+            user_id: User ID
+            login_at: Login timestamp
+        """
+        self._pending_logins[user_id] = login_at
+        if self._login_flusher is None or self._login_flusher.done():
+            self._login_batch_full = asyncio.Event()
+            self._login_flusher = asyncio.create_task(self._flush_logins_soon())
+        elif len(self._pending_logins) >= _FIRESTORE_BATCH_LIMIT:
+            self._login_batch_full.set()
+    
+    async def _flush_logins_soon(self) -> None:
+        """Flush queued logins after _LOGIN_FLUSH_SECONDS, or once a batch is full."""
+        try:
+            await asyncio.wait_for(self._login_batch_full.wait(), _LOGIN_FLUSH_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        await self.flush_logins()
+    
+    async def flush_logins(self) -> None:
+        """
+        Write all queued last_login updates with batched writes.
+        
+        Failed batches are logged, not raised; a lost last_login is not
+        worth failing anyone's request over.
+        """
+        pending, self._pending_logins = self._pending_logins, {}
+        if not pending:
+            return
+        
+        users = self.db.collection('users')
+        
+        def _commit(chunk) -> None:
+            batch = self.db.batch()
+            for user_id, login_at in chunk:
+                batch.update(users.document(user_id), {'last_login': login_at})
+            batch.commit()
+        
+        async def _commit_with_retry(chunk) -> None:
+            for attempt in range(_LOGIN_COMMIT_ATTEMPTS):
+                try:
+                    return await run_blocking(firebase_executor, _commit, chunk)
+                except Aborted:
+                    if attempt == _LOGIN_COMMIT_ATTEMPTS - 1:
+                        raise
+                    await asyncio.sleep(0.1 * 2 ** attempt)
+        
+        chunks = chunk_list(pending.items(), _FIRESTORE_BATCH_LIMIT)
+        results = await asyncio.gather(
+            *(_commit_with_retry(chunk) for chunk in chunks), return_exceptions=True
+        )
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to record {len(chunk)} logins: {result}")
+        
+        for user_id in pending:
+            self.invalidate_user_profile(user_id)
+    
     async def verify_token(self, token: str) -> TokenData:
         """
         Verify Firebase JWT token and extract user data.
         
+        Recent verifications are reused for up to token_cache_ttl seconds,
+        never past the token's own ``exp`` claim. The cache is keyed by a
+        hash of the token, so raw tokens are not kept in memory.
+        
         Args:
             token: Firebase JWT token
             
@@ -185,20 +330,30 @@ class FirebaseService:
         Raises:
             Exception: If token verification fails
         """
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.monotonic()
+        hit = self._token_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        
         try:
             # Verify the token
-            decoded_token = auth.verify_id_token(token)
+            decoded_token = await run_blocking(firebase_executor, auth.verify_id_token, token)
             
             # Extract token data
             token_data = TokenData(
-                user_id=decoded_token['uid'],
-                email=decoded_token.get('email', ''),
-                exp=decoded_token['exp'],
-                iat=decoded_token['iat'],
-                iss=decoded_token['iss'],
-                aud=decoded_token['aud']
+                decoded_token['uid'],
+                decoded_token.get('email', ''),
+                decoded_token['exp'],
+                decoded_token['iat'],
+                decoded_token['iss'],
+                decoded_token['aud']
             )
             
+            ttl = min(self.settings.token_cache_ttl, token_data.exp - time.time())
+            if ttl > 0:
+                self._token_cache[key] = (now + ttl, token_data)
+            
             logger.debug(f"Token verified for user: {token_data.user_id}")
             return token_data
             
@@ -207,6 +362,55 @@ class FirebaseService:
             raise
     
     async def get_user_profile(self, user_id: str) -> Optional[UserProfile]:
+        """
+        Get user profile, served from a short-TTL cache when possible.
+        
+        Concurrent misses for the same user share a single Firestore read.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            UserProfile object or None if not found
+        """
+        profile = self._profile_cache.get(user_id)
+        if profile is not None:
+            return profile
+        
+        lock = self._profile_locks.setdefault(user_id, asyncio.Lock())
+        try:
+            async with lock:
+                profile = self._profile_cache.get(user_id)
+                if profile is None:
+                    profile = await self._fetch_user_profile(user_id)
+                    if profile is not None:
+                        self._profile_cache[user_id] = profile
+                return profile
+        finally:
+            if not lock.locked():
+                self._profile_locks.pop(user_id, None)
+    
+    def invalidate_user_profile(self, user_id: str) -> None:
+        """
+        Drop a cached user profile.
+        
+        Args:
+            user_id: User ID
+        """
+        self._profile_cache.pop(user_id, None)
+    
+    def _evict_user_tokens(self, user_id: str) -> None:
+        """
+        Drop cached token verifications for a user (rare path; scans the cache).
+        
+        Args:
+            user_id: User ID
+        """
+        for key, (_, token_data) in list(self._token_cache.items()):
+            if token_data.user_id == user_id:
+                self._token_cache.pop(key, None)
+    
+    async def _fetch_user_profile(self, user_id: str) -> Optional[UserProfile]:
         """
         Get user profile from Firestore.
         
@@ -217,7 +421,9 @@ class FirebaseService:
             UserProfile object or None if not found
         """
         try:
-            user_doc = self.db.collection('users').document(user_id).get()
+            user_doc = await run_blocking(
+                firebase_executor, self.db.collection('users').document(user_id).get
+            )
             
             if not user_doc.exists:
                 return None
@@ -245,10 +451,13 @@ class FirebaseService:
             True if update successful, False otherwise
         """
         try:
-            # Add updated timestamp
-            updates['updated_at'] = datetime.utcnow()
+            # Add updated timestamp (stamped by Firestore; nothing reads it back here)
+            updates['updated_at'] = firestore.SERVER_TIMESTAMP
             
-            self.db.collection('users').document(user_id).update(updates)
+            await run_blocking(
+                firebase_executor, self.db.collection('users').document(user_id).update, updates
+            )
+            self.invalidate_user_profile(user_id)
             logger.info(f"User profile updated: {user_id}")
             return True
             
@@ -256,6 +465,98 @@ class FirebaseService:
             logger.error(f"Failed to update user profile: {e}")
             return False
     
+    async def update_user_profile_and_get(
+        self, 
+        user_id: str, 
+        updates: Dict[str, Any]
+    ) -> Optional[UserProfile]:
+        """
+        Update user profile in Firestore and return the resulting profile.
+        
+        The read and write run in one transaction and the returned profile is
+        the read snapshot merged with the updates, so no follow-up read is
+        needed.
+        
+        Args:
+            user_id: User ID
+            updates: Dictionary of fields to update
+            
+        Returns:
+            Updated UserProfile object or None if not found
+            
+        Raises:
+            Exception: If the update fails
+        """
+        try:
+            # Add updated timestamp
+            updates['updated_at'] = datetime.utcnow()
+            user_ref = self.db.collection('users').document(user_id)
+            
+            @firestore.transactional
+            def _update(transaction) -> Optional[Dict[str, Any]]:
+                snapshot = user_ref.get(transaction=transaction)
+                if not snapshot.exists:
+                    return None
+                transaction.update(user_ref, updates)
+                user_data = snapshot.to_dict()
+                user_data.update(updates)
+                return user_data
+            
+            user_data = await run_blocking(firebase_executor, _update, self.db.transaction())
+            self.invalidate_user_profile(user_id)
+            if user_data is None:
+                return None
+            
+            logger.info(f"User profile updated: {user_id}")
+            return UserProfile(**user_data)
+            
+        except Exception as e:
+            logger.error(f"Failed to update user profile: {e}")
+            raise
+    
+    async def bulk_update_user_profiles(
+        self, 
+        updates: Dict[str, Dict[str, Any]]
+    ) -> int:
+        """
+        Update many user profiles with batched writes.
+        
+        Updates are grouped into WriteBatches of up to _FIRESTORE_BATCH_LIMIT
+        operations, and the batches are committed concurrently.
+        
+        Args:
+            updates: Mapping of user ID to the fields to update
+            
+        Returns:
+            Number of profiles updated
+            
+        Raises:
+            Exception: If any batch commit fails
+        """
+        try:
+            users = self.db.collection('users')
+            
+            def _commit(chunk) -> None:
+                batch = self.db.batch()
+                for user_id, fields in chunk:
+                    batch.update(
+                        users.document(user_id), {**fields, 'updated_at': firestore.SERVER_TIMESTAMP}
+                    )
+                batch.commit()
+            
+            chunks = chunk_iter(updates.items(), _FIRESTORE_BATCH_LIMIT)
+            await asyncio.gather(*(run_blocking(firebase_executor, _commit, chunk) for chunk in chunks))
+            
+            for user_id in updates:
+                self.invalidate_user_profile(user_id)
+            
+            logger.info(f"Bulk updated {len(updates)} user profiles")
+            return len(updates)
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk update user profiles: {e}")
+            raise
+    
     async def delete_user(self, user_id: str) -> bool:
         """
         Delete user from Firebase Auth and Firestore.
@@ -268,10 +569,14 @@ class FirebaseService:
         """
         try:
             # Delete from Firebase Auth
-            auth.delete_user(user_id)
+            await run_blocking(firebase_executor, auth.delete_user, user_id)
             
             # Delete from Firestore
-            self.db.collection('users').document(user_id).delete()
+            await run_blocking(
+                firebase_executor, self.db.collection('users').document(user_id).delete
+            )
+            self.invalidate_user_profile(user_id)
+            self._evict_user_tokens(user_id)
             
             logger.info(f"User deleted successfully: {user_id}")
             return True
@@ -291,7 +596,9 @@ class FirebaseService:
             True if revocation successful, False otherwise
         """
         try:
-            auth.revoke_refresh_tokens(user_id)
+            await run_blocking(firebase_executor, auth.revoke_refresh_tokens, user_id)
+            self.invalidate_user_profile(user_id)
+            self._evict_user_tokens(user_id)
             logger.info(f"Refresh tokens revoked for user: {user_id}")
             return True
             
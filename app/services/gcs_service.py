@@ -2,19 +2,36 @@
 Google Cloud Storage integration for video file management.
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import time
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
 from urllib.parse import urlparse
 
+from cachetools import TTLCache
 from google.cloud import storage
-from google.cloud.exceptions import NotFound
+from google.cloud.exceptions import NotFound, from_http_response
 from google.auth.exceptions import DefaultCredentialsError
 
 from app.config import get_settings
+from app.services.clients import get_signing_credentials, get_storage_client
+from app.services.executors import gcs_executor, run_blocking
+from app.utils.helpers import chunk_list
 
 logger = logging.getLogger(__name__)
 
+# GCS accepts at most 100 sub-requests per batch call
+_DELETE_BATCH_SIZE = 100
+
+# Signed URL expiries are rounded up to this granularity, so requests for the
+# same object within one window reuse a single signature
+_SIGNED_URL_WINDOW_SECONDS = 60
+_SIGNED_URL_CACHE_SIZE = 20_000
+
+# Storage usage is totalled from parallel listings split on these characters
+_HEX_DIGITS = "0123456789abcdef"
+
 
 class GCSService:
     """Google Cloud Storage service for file operations."""
@@ -22,20 +39,21 @@ class GCSService:
     def __init__(self):
         """Initialize GCS service."""
         self.settings = get_settings()
-        self._client = None
         self._bucket = None
+        self._signed_url_cache: TTLCache = TTLCache(
+            maxsize=_SIGNED_URL_CACHE_SIZE, ttl=_SIGNED_URL_WINDOW_SECONDS
+        )
+        # Signatures being computed, so concurrent misses for a key share one sign
+        self._signing: Dict[Tuple, asyncio.Task] = {}
     
     @property
     def client(self) -> storage.Client:
         """Get GCS client."""
-        if self._client is None:
-            try:
-                self._client = storage.Client(project=self.settings.google_cloud_project_id)
-            except DefaultCredentialsError:
-                logger.warning("GCS credentials not found. Service will be limited.")
-                # Create a dummy client for testing
-                self._client = None
-        return self._client
+        try:
+            return get_storage_client()
+        except DefaultCredentialsError:
+            logger.warning("GCS credentials not found. Service will be limited.")
+            return None
     
     @property
     def bucket(self) -> storage.Bucket:
@@ -51,6 +69,20 @@ class GCSService:
                 raise
         return self._bucket
     
+    async def _get_bucket(self) -> storage.Bucket:
+        """
+        Get GCS bucket without blocking the event loop on first use.
+        
+        Creating the client can hit the metadata server for credentials, so
+        the first resolution runs on the GCS thread pool.
+        
+        Returns:
+            GCS bucket
+        """
+        if self._bucket is None:
+            return await run_blocking(gcs_executor, lambda: self.bucket)
+        return self._bucket
+    
     def _get_file_path(self, user_id: str, video_id: str, filename: str) -> str:
         """
         Generate standardized file path.
@@ -92,6 +124,125 @@ class GCSService:
         """
         return f"users/{user_id}/videos/{video_id}/converted_{format_type}.mp4"
     
+    def get_upload_blob_paths(self, user_id: str, video_id: str, filename: str) -> List[str]:
+        """
+        Get the object paths an upload writes, for the video's blob manifest.
+        
+        Args:
+            user_id: User ID
+            video_id: Video ID
+            filename: Original filename
+            
+        Returns:
+            Object paths
+        """
+        return [self._get_file_path(user_id, video_id, filename)]
+    
+    def get_conversion_blob_paths(self, user_id: str, video_id: str, filename: str) -> List[str]:
+        """
+        Get the object paths a conversion writes, for the video's blob manifest.
+        
+        Args:
+            user_id: User ID
+            video_id: Video ID
+            filename: Original filename
+            
+        Returns:
+            Object paths
+        """
+        return [
+            self._get_file_path(user_id, video_id, f"converted_vr180_{filename}"),
+            self._get_thumbnail_path(user_id, video_id)
+        ]
+    
+    async def _sign_url(
+        self,
+        file_path: str,
+        method: str,
+        expiration_minutes: int,
+        content_type: Optional[str] = None
+    ) -> Tuple[str, datetime]:
+        """
+        Generate a V4 signed URL, reusing one signed in the same time window.
+        
+        Concurrent requests for the same URL wait on a single signing call.
+        
+        Args:
+            file_path: Object path within the bucket
+            method: HTTP method the URL authorizes
+            expiration_minutes: Minimum URL lifetime in minutes
+            content_type: Content type the request must send (uploads only)
+            
+        Returns:
+            Tuple of signed URL and its expiration time (naive UTC)
+        """
+        window = _SIGNED_URL_WINDOW_SECONDS
+        expires_ts = (int(time.time()) // window + 1) * window + expiration_minutes * 60
+        expiration = datetime.utcfromtimestamp(expires_ts)
+        
+        key = (method, file_path, content_type, expires_ts)
+        signed_url = self._signed_url_cache.get(key)
+        if signed_url is not None:
+            return signed_url, expiration
+        
+        task = self._signing.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._generate_signed_url(file_path, method, expiration, content_type)
+            )
+            self._signing[key] = task
+            
+            def _on_done(done: asyncio.Task) -> None:
+                self._signing.pop(key, None)
+                if not done.cancelled() and done.exception() is None:
+                    self._signed_url_cache[key] = done.result()
+            
+            task.add_done_callback(_on_done)
+        
+        return await asyncio.shield(task), expiration
+    
+    async def _generate_signed_url(
+        self,
+        file_path: str,
+        method: str,
+        expiration: datetime,
+        content_type: Optional[str]
+    ) -> str:
+        """
+        Sign a V4 URL.
+        
+        With a service-account key configured the signature is computed
+        locally, inline; otherwise the SDK may call IAM signBlob, so signing
+        runs on the GCS thread pool.
+        
+        Args:
+            file_path: Object path within the bucket
+            method: HTTP method the URL authorizes
+            expiration: URL expiration time (naive UTC)
+            content_type: Content type the request must send (uploads only)
+            
+        Returns:
+            Signed URL
+        """
+        blob = (await self._get_bucket()).blob(file_path)
+        credentials = get_signing_credentials()
+        if credentials is not None:
+            return blob.generate_signed_url(
+                version="v4",
+                expiration=expiration,
+                method=method,
+                content_type=content_type,
+                credentials=credentials
+            )
+        return await run_blocking(
+            gcs_executor,
+            blob.generate_signed_url,
+            version="v4",
+            expiration=expiration,
+            method=method,
+            content_type=content_type
+        )
+    
     async def generate_signed_upload_url(
         self,
         user_id: str,
@@ -117,20 +268,9 @@ class GCSService:
             # Generate file path
             file_path = self._get_file_path(user_id, video_id, filename)
             
-            # Create blob
-            blob = self.bucket.blob(file_path)
-            
-            # Set content type
-            blob.content_type = content_type
-            
             # Generate signed URL for upload
-            expiration = datetime.utcnow() + timedelta(minutes=expiration_minutes)
-            
-            signed_url = blob.generate_signed_url(
-                version="v4",
-                expiration=expiration,
-                method="PUT",
-                content_type=content_type
+            signed_url, expiration = await self._sign_url(
+                file_path, "PUT", expiration_minutes, content_type=content_type
             )
             
             # Prepare metadata
@@ -177,24 +317,21 @@ class GCSService:
             file_path = self._get_file_path(user_id, video_id, filename)
             
             # Get blob
-            blob = self.bucket.blob(file_path)
-            
-            # Check if file exists
-            if not blob.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-            
-            # Generate signed URL for download
-            expiration = datetime.utcnow() + timedelta(minutes=expiration_minutes)
+            blob = (await self._get_bucket()).blob(file_path)
             
-            signed_url = blob.generate_signed_url(
-                version="v4",
-                expiration=expiration,
-                method="GET"
+            async def _load_metadata() -> None:
+                # Get file metadata; a missing object surfaces as NotFound
+                try:
+                    await run_blocking(gcs_executor, blob.reload)
+                except NotFound:
+                    raise FileNotFoundError(f"File not found: {file_path}")
+            
+            # Signing does not depend on the metadata, so overlap the two
+            (signed_url, expiration), _ = await asyncio.gather(
+                self._sign_url(file_path, "GET", expiration_minutes),
+                _load_metadata()
             )
             
-            # Get file metadata
-            blob.reload()
-            
             download_metadata = {
                 'file_path': file_path,
                 'content_type': blob.content_type,
@@ -236,13 +373,13 @@ class GCSService:
         """
         try:
             file_path = self._get_file_path(user_id, video_id, filename)
-            blob = self.bucket.blob(file_path)
+            blob = (await self._get_bucket()).blob(file_path)
             
-            if not blob.exists():
+            try:
+                await run_blocking(gcs_executor, blob.reload)
+            except NotFound:
                 return None
             
-            blob.reload()
-            
             return {
                 'file_path': file_path,
                 'content_type': blob.content_type,
@@ -276,27 +413,40 @@ class GCSService:
         """
         try:
             file_path = self._get_file_path(user_id, video_id, filename)
-            blob = self.bucket.blob(file_path)
+            blob = (await self._get_bucket()).blob(file_path)
             
-            if blob.exists():
-                blob.delete()
-                logger.info(f"File deleted: {file_path}")
-                return True
-            else:
+            try:
+                await run_blocking(gcs_executor, blob.delete)
+            except NotFound:
                 logger.warning(f"File not found for deletion: {file_path}")
                 return False
+            
+            logger.info(f"File deleted: {file_path}")
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to delete file: {e}")
             return False
     
-    async def delete_video_files(self, user_id: str, video_id: str) -> Dict[str, bool]:
+    async def delete_video_files(
+        self,
+        user_id: str,
+        video_id: str,
+        blob_paths: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
         """
         Delete all files associated with a video.
         
+        Blobs are deleted through the GCS batch endpoint, up to
+        _DELETE_BATCH_SIZE deletes per HTTP request, with all batch
+        requests in flight at once. When the video's blob manifest is
+        given, the deletes are issued directly; otherwise the video's
+        folder is listed first (videos created before the manifest).
+        
         Args:
             user_id: User ID
             video_id: Video ID
+            blob_paths: Object paths recorded for the video, if known
             
         Returns:
             Dictionary with deletion results for each file type
@@ -304,18 +454,31 @@ class GCSService:
         try:
             results = {}
             
-            # List all files in the video directory
             prefix = f"users/{user_id}/videos/{video_id}/"
-            blobs = self.bucket.list_blobs(prefix=prefix)
+            if blob_paths is not None:
+                bucket = await self._get_bucket()
+                blobs = [bucket.blob(path) for path in dict.fromkeys(blob_paths)]
+            else:
+                # List all files in the video directory
+                blobs = await run_blocking(
+                    gcs_executor, lambda: list(self.bucket.list_blobs(prefix=prefix))
+                )
+            
+            # Send all batches concurrently; the executor bounds parallelism
+            chunks = chunk_list(blobs, _DELETE_BATCH_SIZE)
+            outcomes = await asyncio.gather(
+                *(run_blocking(gcs_executor, self._delete_blob_batch, chunk) for chunk in chunks),
+                return_exceptions=True
+            )
             
-            for blob in blobs:
-                try:
-                    blob.delete()
-                    results[blob.name] = True
-                    logger.info(f"Deleted file: {blob.name}")
-                except Exception as e:
-                    results[blob.name] = False
-                    logger.error(f"Failed to delete file {blob.name}: {e}")
+            for chunk, outcome in zip(chunks, outcomes):
+                deleted = not isinstance(outcome, Exception)
+                for blob in chunk:
+                    results[blob.name] = deleted
+                if deleted:
+                    logger.info(f"Deleted {len(chunk)} files under: {prefix}")
+                else:
+                    logger.error(f"Failed to delete files under {prefix}: {outcome}")
             
             return results
             
@@ -323,6 +486,37 @@ class GCSService:
             logger.error(f"Failed to delete video files: {e}")
             raise
     
+    def _delete_blob_batch(self, blobs: List[storage.Blob]) -> None:
+        """
+        Delete blobs in a single batch request.
+        
+        Manifest entries may name objects that were never written (an
+        unused upload URL, a conversion that failed), so a 404 is treated
+        as already deleted. The batch's other deletes still run server-side.
+        
+        Args:
+            blobs: Blobs to delete (at most _DELETE_BATCH_SIZE)
+            
+        Raises:
+            GoogleAPICallError: If any delete in the batch fails for a reason
+                other than the object not existing
+        """
+        # With raise_exception=True the batch raises only the first failure,
+        # so a 404 would hide later errors; check every sub-response instead.
+        # The context manager discards finish()'s return value, so the
+        # sub-responses are read from Batch._responses, where finish() keeps
+        # them (google-cloud-storage >= 2.14, pinned in requirements.txt).
+        batch = self.client.batch(raise_exception=False)
+        with batch:
+            for blob in blobs:
+                blob.delete()
+        
+        for response in batch._responses:
+            if response.status_code == 404:
+                continue
+            if response.status_code >= 400:
+                raise from_http_response(response)
+    
     async def copy_file(
         self,
         source_user_id: str,
@@ -350,8 +544,11 @@ class GCSService:
             source_path = self._get_file_path(source_user_id, source_video_id, source_filename)
             dest_path = self._get_file_path(dest_user_id, dest_video_id, dest_filename)
             
-            source_blob = self.bucket.blob(source_path)
-            dest_blob = self.bucket.copy_blob(source_blob, self.bucket, dest_path)
+            bucket = await self._get_bucket()
+            source_blob = bucket.blob(source_path)
+            dest_blob = await run_blocking(
+                gcs_executor, bucket.copy_blob, source_blob, bucket, dest_path
+            )
             
             logger.info(f"File copied: {source_path} -> {dest_path}")
             return True
@@ -360,6 +557,52 @@ class GCSService:
             logger.error(f"Failed to copy file: {e}")
             return False
     
+    def _summarize_range(
+        self,
+        prefix: str,
+        start_offset: Optional[str] = None,
+        end_offset: Optional[str] = None
+    ) -> Tuple[int, int, int]:
+        """
+        Total up every object under a prefix within a name range (blocking).
+        
+        Args:
+            prefix: Object name prefix
+            start_offset: Only count names >= this, if given
+            end_offset: Only count names < this, if given
+            
+        Returns:
+            Tuple of (total size in bytes, file count, video file count)
+        """
+        return self._summarize_blobs(self.bucket.list_blobs(
+            prefix=prefix, start_offset=start_offset, end_offset=end_offset
+        ))
+    
+    @staticmethod
+    def _summarize_blobs(blobs) -> Tuple[int, int, int]:
+        """
+        Total up a set of blobs.
+        
+        Args:
+            blobs: Iterable of blobs
+            
+        Returns:
+            Tuple of (total size in bytes, file count, video file count)
+        """
+        total_size = 0
+        file_count = 0
+        video_count = 0
+        
+        for blob in blobs:
+            total_size += blob.size
+            file_count += 1
+            
+            # Count videos (directories with video files)
+            if blob.name.endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm')):
+                video_count += 1
+        
+        return total_size, file_count, video_count
+    
     async def get_storage_usage(self, user_id: str) -> Dict[str, Any]:
         """
         Get storage usage for a user.
@@ -371,20 +614,25 @@ class GCSService:
             Dictionary containing storage usage statistics
         """
         try:
-            prefix = f"users/{user_id}/"
-            blobs = self.bucket.list_blobs(prefix=prefix)
-            
-            total_size = 0
-            file_count = 0
-            video_count = 0
-            
-            for blob in blobs:
-                total_size += blob.size
-                file_count += 1
-                
-                # Count videos (directories with video files)
-                if blob.name.endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm')):
-                    video_count += 1
+            user_prefix = f"users/{user_id}/"
+            videos_prefix = f"{user_prefix}videos/"
+            
+            # Video IDs are hex UUIDs, so the flat videos/ listing splits evenly
+            # into 16 ranges on the first character of the ID. The first and
+            # last ranges are open-ended, so names outside 0-f are still counted.
+            bounds = [None] + [videos_prefix + digit for digit in _HEX_DIGITS[1:]] + [None]
+            ranges = [(videos_prefix, start, end) for start, end in zip(bounds, bounds[1:])]
+            
+            # Everything else under the user folder sorts either before
+            # "videos/" or after its last name ("0" is the character after "/")
+            ranges.append((user_prefix, None, videos_prefix))
+            ranges.append((user_prefix, f"{user_prefix}videos0", None))
+            
+            totals = await asyncio.gather(*(
+                run_blocking(gcs_executor, self._summarize_range, prefix, start, end)
+                for prefix, start, end in ranges
+            ))
+            total_size, file_count, video_count = (sum(column) for column in zip(*totals))
             
             return {
                 'total_size_bytes': total_size,
@@ -406,6 +654,8 @@ class GCSService:
         """
         Generate public URL for a file (if bucket allows public access).
         
+        The URL is built locally; no request is made to check the object.
+        
         Args:
             user_id: User ID
             video_id: Video ID
@@ -414,18 +664,10 @@ class GCSService:
         Returns:
             Public URL
         """
-        try:
-            file_path = self._get_file_path(user_id, video_id, filename)
-            blob = self.bucket.blob(file_path)
-            
-            if not blob.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-            
-            return f"https://storage.googleapis.com/{self.settings.google_cloud_storage_bucket}/{file_path}"
-            
-        except Exception as e:
-            logger.error(f"Failed to generate public URL: {e}")
-            raise
+        return (
+            f"https://storage.googleapis.com/{self.settings.google_cloud_storage_bucket}/"
+            f"{self._get_file_path(user_id, video_id, filename)}"
+        )
 
 
 # Global GCS service instance
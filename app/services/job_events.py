@@ -0,0 +1,87 @@
+"""
+Push-based job status updates backed by Firestore snapshot listeners.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from app.services.firebase_service import firebase_service
+
+logger = logging.getLogger(__name__)
+
+# Listener per job, shared by every subscriber to that job
+_watches: Dict[str, "_JobWatch"] = {}
+
+
+class _JobWatch:
+    """One Firestore document listener fanning snapshots out to subscriber queues."""
+    
+    def __init__(self, job_id: str):
+        """
+        Start listening to a job document.
+        
+        Args:
+            job_id: Job ID
+        """
+        self.job_id = job_id
+        self.queues: Set[asyncio.Queue] = set()
+        self.latest: Optional[Dict[str, Any]] = None
+        self._loop = asyncio.get_running_loop()
+        document = firebase_service.db.collection('jobs').document(job_id)
+        self._watch = document.on_snapshot(self._on_snapshot)
+    
+    def _on_snapshot(self, snapshots, changes, read_time) -> None:
+        """Listener callback; runs on the Firestore watch thread."""
+        for snapshot in snapshots:
+            data = snapshot.to_dict() if snapshot.exists else None
+            self._loop.call_soon_threadsafe(self._publish, data)
+    
+    def _publish(self, data: Optional[Dict[str, Any]]) -> None:
+        """Deliver a snapshot to every subscriber (on the event loop)."""
+        self.latest = data
+        for queue in self.queues:
+            queue.put_nowait(data)
+    
+    def close(self) -> None:
+        """Stop the Firestore listener."""
+        try:
+            self._watch.unsubscribe()
+        except Exception as e:
+            logger.warning(f"Failed to stop job listener {self.job_id}: {e}")
+
+
+@asynccontextmanager
+async def subscribe_job(job_id: str) -> AsyncIterator[asyncio.Queue]:
+    """
+    Subscribe to changes of a job document.
+    
+    The queue receives the job document data every time it changes (None
+    if the document was deleted), starting with the latest known snapshot.
+    Subscribers to the same job share one Firestore listener, which is
+    stopped when the last subscriber leaves.
+    
+    Args:
+        job_id: Job ID
+    
+    Yields:
+        Queue of job document snapshots
+    """
+    watch = _watches.get(job_id)
+    if watch is None:
+        watch = _JobWatch(job_id)
+        _watches[job_id] = watch
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    watch.queues.add(queue)
+    if watch.latest is not None:
+        queue.put_nowait(watch.latest)
+    
+    try:
+        yield queue
+    finally:
+        watch.queues.discard(queue)
+        if not watch.queues and _watches.get(job_id) is watch:
+            del _watches[job_id]
+            watch.close()
@@ -5,13 +5,13 @@ Video processing service for 2D to VR 180° conversion using MiDaS and FFmpeg.
 import os
 import logging
 import asyncio
-from typing import Dict, Any, Optional, Tuple
+from multiprocessing import shared_memory
+from typing import Dict, Any, AsyncIterator, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 import tempfile
 import shutil
 
 try:
-    import cv2
     import numpy as np
     import torch
     import ffmpeg
@@ -20,15 +20,6 @@ try:
 except ImportError:
     DEPENDENCIES_AVAILABLE = False
     # Create dummy classes for when dependencies are not available
-    class cv2:
-        VideoCapture = None
-        CAP_PROP_FRAME_COUNT = None
-        CAP_PROP_FPS = None
-        imread = None
-        imwrite = None
-        cvtColor = None
-        COLOR_BGR2RGB = None
-        COLOR_RGB2BGR = None
     class np:
         array = None
         ndarray = None
@@ -36,6 +27,7 @@ except ImportError:
         hub = None
         cuda = None
         nn = None
+        Tensor = None
     class ffmpeg:
         input = None
         run = None
@@ -43,11 +35,55 @@ except ImportError:
     class Image:
         pass
 
+try:
+    import torch_tensorrt  # Registers the "torch_tensorrt" torch.compile backend
+    TENSORRT_AVAILABLE = True
+except ImportError:
+    TENSORRT_AVAILABLE = False
+
 from app.config import get_settings
 from app.models.video import VideoStatusEnum, ConversionSettings
+from app.services.executors import get_cpu_executor, inference_executor, media_executor, run_blocking
 
 logger = logging.getLogger(__name__)
 
+# MiDaS_small input: longer side at most 256, both sides multiples of 32,
+# normalized with the ImageNet statistics it was trained with
+_MIDAS_INPUT_SIZE = 256
+_MIDAS_SIZE_MULTIPLE = 32
+_MIDAS_MEAN = (0.485, 0.456, 0.406)
+_MIDAS_STD = (0.229, 0.224, 0.225)
+
+
+class _StereoBatchLayout(NamedTuple):
+    """Layout of a frame batch, its depth maps and stereo output in one shared-memory block."""
+    
+    batch_size: int
+    height: int
+    width: int
+    stereo_mode: str
+    
+    @property
+    def stereo_shape(self) -> Tuple[int, int, int, int]:
+        if self.stereo_mode == "side-by-side":
+            return (self.batch_size, self.height, self.width * 2, 3)
+        return (self.batch_size, self.height * 2, self.width, 3)
+    
+    @property
+    def size(self) -> int:
+        pixels = self.batch_size * self.height * self.width
+        return pixels * 3 + pixels + pixels * 6
+    
+    def views(self, buffer) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get (frames uint8 [B, H, W, 3], depth uint8 [B, H, W], stereo uint8) views of a block."""
+        shape = (self.batch_size, self.height, self.width)
+        frames = np.ndarray(shape + (3,), dtype=np.uint8, buffer=buffer)
+        depth_maps = np.ndarray(shape, dtype=np.uint8, buffer=buffer, offset=frames.nbytes)
+        stereo = np.ndarray(
+            self.stereo_shape, dtype=np.uint8, buffer=buffer, offset=frames.nbytes + depth_maps.nbytes
+        )
+        return frames, depth_maps, stereo
+
 
 class VideoProcessingService:
     """Video processing service for VR 180° conversion."""
@@ -57,6 +93,9 @@ class VideoProcessingService:
         self.settings = get_settings()
         self._midas_model = None
         self._device = None
+        self._dtype = None  # Inference dtype; None keeps the model's FP32
+        self._midas_mean = None
+        self._midas_std = None
         
         if not DEPENDENCIES_AVAILABLE:
             logger.warning("Video processing dependencies not available. Service will be limited.")
@@ -69,20 +108,59 @@ class VideoProcessingService:
             logger.info(f"Using device: {self._device}")
         return self._device
     
+    @property
+    def use_hwaccel(self) -> bool:
+        """Whether FFmpeg should decode with NVDEC and encode with NVENC."""
+        return self.settings.video_hwaccel and self.device == "cuda"
+    
     @property
     def midas_model(self):
         """Get MiDaS depth estimation model."""
         if self._midas_model is None:
             try:
-                # Load MiDaS model
+                # Built locally and cached only once fully set up, so a failed
+                # step (e.g. CUDA OOM) is retried on the next job instead of
+                # leaving a half-initialized model behind
                 model_type = "MiDaS_small"  # Use small model for faster processing
-                self._midas_model = torch.hub.load("intel-isl/MiDaS", model_type)
-                self._midas_model.to(self.device)
-                self._midas_model.eval()
+                model = torch.hub.load("intel-isl/MiDaS", model_type)
+                model.to(self.device)
+                model.eval()
+                dtype = None
+                
+                # Half precision on GPU: Tensor Core GEMMs and half the weight
+                # bandwidth; bfloat16 where supported avoids FP16 overflow
+                if self.device == "cuda":
+                    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                    model.to(dtype=dtype)
+                    
+                    # Build TensorRT engines (layer fusion, kernel autotuning) when
+                    # available; engines are cached on disk per graph, input
+                    # shape and precision, so later jobs skip the build
+                    if TENSORRT_AVAILABLE:
+                        model = torch.compile(
+                            model,
+                            backend="torch_tensorrt",
+                            dynamic=False,
+                            options={
+                                "enabled_precisions": {dtype},
+                                "cache_built_engines": True,
+                                "reuse_cached_engines": True,
+                                "engine_cache_dir": self.settings.tensorrt_engine_cache_dir
+                            }
+                        )
+                    # Otherwise fuse kernels and replay CUDA graphs instead of
+                    # dispatching each op from Python; compiled on the first batch
+                    elif hasattr(torch, "compile"):
+                        model = torch.compile(model, mode="reduce-overhead", dynamic=False)
+                
+                # Normalization constants for the on-device transform, allocated once
+                mean = torch.tensor(_MIDAS_MEAN, device=self.device).view(1, 3, 1, 1)
+                std = torch.tensor(_MIDAS_STD, device=self.device).view(1, 3, 1, 1)
                 
-                # Load transforms
-                midas_transforms = torch.hub.load("intel-isl/MiDaS", "transforms")
-                self._midas_transforms = midas_transforms.small_transform
+                self._dtype = dtype
+                self._midas_mean = mean
+                self._midas_std = std
+                self._midas_model = model
                 
                 logger.info("MiDaS model loaded successfully")
             except Exception as e:
@@ -120,26 +198,9 @@ class VideoProcessingService:
             
             # Create temporary directory for processing
             with tempfile.TemporaryDirectory() as temp_dir:
-                # Extract frames
-                frames_dir = os.path.join(temp_dir, "frames")
-                os.makedirs(frames_dir, exist_ok=True)
-                
-                await self._extract_frames(input_path, frames_dir, progress_callback)
-                
-                # Process frames for depth estimation and stereo generation
-                processed_frames_dir = os.path.join(temp_dir, "processed_frames")
-                os.makedirs(processed_frames_dir, exist_ok=True)
-                
+                # Decode, convert and encode frames in a single in-memory pass
                 await self._process_frames_for_vr180(
-                    frames_dir, 
-                    processed_frames_dir, 
-                    conversion_settings,
-                    progress_callback
-                )
-                
-                # Generate VR 180° video
-                await self._generate_vr180_video(
-                    processed_frames_dir, 
+                    input_path, 
                     output_path, 
                     conversion_settings,
                     progress_callback
@@ -167,189 +228,558 @@ class VideoProcessingService:
                 'error': str(e)
             }
     
-    async def _extract_frames(
+    def _probe_video_stream(self, video_path: str) -> Dict[str, Any]:
+        """
+        Get display size, frame rate and frame count of a video's first video stream.
+        
+        Sizes are as FFmpeg decodes them, i.e. after applying rotation metadata.
+        """
+        probe = ffmpeg.probe(video_path)
+        video_stream = next(s for s in probe['streams'] if s['codec_type'] == 'video')
+        
+        width, height = int(video_stream['width']), int(video_stream['height'])
+        rotation = int(video_stream.get('tags', {}).get('rotate', 0))
+        for side_data in video_stream.get('side_data_list', []):
+            rotation = int(side_data.get('rotation', rotation))
+        if rotation % 180:
+            width, height = height, width
+        
+        fps = self._parse_frame_rate(video_stream.get('avg_frame_rate', '0/0')) \
+            or self._parse_frame_rate(video_stream['r_frame_rate'])
+        frame_count = int(video_stream.get('nb_frames') or 0) \
+            or int(float(probe['format'].get('duration', 0)) * fps)
+        
+        return {'width': width, 'height': height, 'fps': fps, 'frame_count': frame_count}
+    
+    @staticmethod
+    def _parse_frame_rate(rate: str) -> float:
+        """Parse an FFmpeg rational frame rate such as "30000/1001" (0.0 if unknown)."""
+        num, _, den = rate.partition('/')
+        den = int(den or 1)
+        return int(num) / den if den else 0.0
+    
+    def _start_frame_decoder(self, video_path: str, frame_rate: Optional[float]):
+        """
+        Start an FFmpeg process decoding a video to raw RGB frames on its stdout.
+        
+        Args:
+            video_path: Input video file
+            frame_rate: Output frame rate to resample to, or None for the source rate
+            
+        Returns:
+            FFmpeg subprocess; read width * height * 3 bytes per frame from its stdout
+        """
+        output_args = {'format': 'rawvideo', 'pix_fmt': 'rgb24'}
+        if frame_rate:
+            output_args['r'] = frame_rate
+        
+        # NVDEC decodes on the GPU; frames are downloaded for the raw pipe
+        input_args = {'hwaccel': 'cuda'} if self.use_hwaccel else {}
+        
+        stream = ffmpeg.output(ffmpeg.input(video_path, **input_args), 'pipe:', **output_args)
+        stream = stream.global_args('-loglevel', 'error', '-nostats')
+        return ffmpeg.run_async(stream, pipe_stdout=True)
+    
+    @staticmethod
+    def _read_frame_batch(decoder, width: int, height: int, batch_size: int) -> List[np.ndarray]:
+        """Read up to batch_size raw RGB frames from a decoder's stdout (blocking; short at end of stream)."""
+        frame_size = width * height * 3
+        batch = []
+        while len(batch) < batch_size:
+            raw = decoder.stdout.read(frame_size)
+            if len(raw) < frame_size:
+                break
+            batch.append(np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 3))
+        return batch
+    
+    async def _iter_frame_batches(
         self, 
-        video_path: str, 
-        frames_dir: str, 
-        progress_callback=None
-    ) -> None:
-        """Extract frames from video."""
+        decoder, 
+        width: int, 
+        height: int, 
+        batch_size: int
+    ) -> AsyncIterator[List[np.ndarray]]:
+        """
+        Read raw RGB frames from a decoder's stdout in batches.
+        
+        Pipe reads run on the media pool, one batch ahead of the consumer,
+        so decoding overlaps conversion and never blocks the event loop.
+        """
+        def read_ahead() -> asyncio.Future:
+            return asyncio.ensure_future(run_blocking(
+                media_executor, self._read_frame_batch, decoder, width, height, batch_size
+            ))
+        
+        pending = read_ahead()
         try:
-            cap = cv2.VideoCapture(video_path)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            
-            logger.info(f"Extracting {frame_count} frames at {fps} FPS")
-            
-            frame_idx = 0
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                # Save frame
-                frame_path = os.path.join(frames_dir, f"frame_{frame_idx:06d}.jpg")
-                cv2.imwrite(frame_path, frame)
-                
-                frame_idx += 1
-                
-                # Update progress
-                if progress_callback:
-                    progress = (frame_idx / frame_count) * 20  # 20% of total progress
-                    await progress_callback(progress, "Extracting frames")
-            
-            cap.release()
-            logger.info(f"Extracted {frame_idx} frames")
-            
-        except Exception as e:
-            logger.error(f"Frame extraction failed: {e}")
-            raise
+            while pending is not None:
+                batch = await pending
+                # A short batch means the stream has ended
+                pending = read_ahead() if len(batch) == batch_size else None
+                if batch:
+                    yield batch
+        finally:
+            if pending is not None:
+                pending.cancel()
     
     async def _process_frames_for_vr180(
         self,
-        frames_dir: str,
-        output_dir: str,
+        video_path: str,
+        output_path: str,
         conversion_settings: ConversionSettings,
         progress_callback=None
     ) -> None:
-        """Process frames for VR 180° conversion."""
+        """
+        Convert a video to VR 180° frame by frame, without intermediate files.
+        
+        FFmpeg decodes (and resamples) the input straight to raw RGB frames;
+        they go through depth estimation and stereo generation in memory and
+        are piped as raw RGB into the encoder, so no frame is ever
+        JPEG-encoded or written to disk.
+        """
+        decoder = None
+        encoder = None
         try:
-            frame_files = sorted([f for f in os.listdir(frames_dir) if f.endswith('.jpg')])
-            total_frames = len(frame_files)
+            source = await run_blocking(media_executor, self._probe_video_stream, video_path)
+            width, height, fps = source['width'], source['height'], source['fps']
             
-            logger.info(f"Processing {total_frames} frames for VR 180°")
+            # Drop frames when the source is faster than the output (never duplicate)
+            target_fps = conversion_settings.frame_rate
+            resample_fps = target_fps if target_fps and (not fps or target_fps < fps) else None
+            output_fps = resample_fps or fps
+            total_frames = max(1, int(source['frame_count'] * output_fps / fps)) if fps else 1
             
-            for idx, frame_file in enumerate(frame_files):
-                frame_path = os.path.join(frames_dir, frame_file)
-                output_path = os.path.join(output_dir, frame_file)
-                
-                # Load frame
-                frame = cv2.imread(frame_path)
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Estimate depth
-                depth_map = await self._estimate_depth(frame_rgb)
+            logger.info(
+                f"Processing {total_frames} of {source['frame_count']} frames at {fps} FPS for VR 180°"
+            )
+            
+            decoder = self._start_frame_decoder(video_path, resample_fps)
+            
+            batches = self._iter_frame_batches(
+                decoder, width, height, self.settings.depth_batch_size
+            )
+            convert_batches = self._convert_batches_gpu if self.device == "cuda" else self._convert_batches_cpu
+            
+            processed = 0
+            async for stereo_frames in convert_batches(batches, conversion_settings):
+                if encoder is None:
+                    stereo_height, stereo_width = stereo_frames.shape[1:3]
+                    encoder = self._start_vr180_encoder(
+                        output_path, stereo_width, stereo_height, output_fps, conversion_settings
+                    )
                 
-                # Generate stereo pair
-                stereo_frame = await self._generate_stereo_pair(frame_rgb, depth_map, conversion_settings)
+                # The whole batch in one pipe write, off the event loop
+                await run_blocking(media_executor, encoder.stdin.write, stereo_frames)
                 
-                # Save processed frame
-                stereo_bgr = cv2.cvtColor(stereo_frame, cv2.COLOR_RGB2BGR)
-                cv2.imwrite(output_path, stereo_bgr)
+                processed += len(stereo_frames)
                 
                 # Update progress
                 if progress_callback:
-                    progress = 20 + (idx / total_frames) * 60  # 60% of total progress
+                    progress = min(processed / total_frames, 1.0) * 90  # 90% of total progress
                     await progress_callback(progress, "Processing frames for VR 180°")
             
-            logger.info("Frame processing completed")
+            if await run_blocking(media_executor, decoder.wait) != 0:
+                raise RuntimeError(f"FFmpeg decoder exited with status {decoder.returncode}")
+            
+            if encoder is None:
+                raise ValueError("No frames decoded")
+            
+            await run_blocking(media_executor, encoder.stdin.close)
+            if await run_blocking(media_executor, encoder.wait) != 0:
+                raise RuntimeError(f"FFmpeg encoder exited with status {encoder.returncode}")
+            
+            if progress_callback:
+                await progress_callback(100, "Video generation completed")
+            
+            logger.info(f"VR 180° video generated from {processed} frames: {output_path}")
             
         except Exception as e:
             logger.error(f"Frame processing failed: {e}")
             raise
+        finally:
+            for process in (decoder, encoder):
+                if process is not None and process.poll() is None:
+                    process.kill()
+    
+    async def _convert_batches_cpu(
+        self, 
+        batches: AsyncIterator[List[np.ndarray]], 
+        conversion_settings: ConversionSettings
+    ) -> AsyncIterator[np.ndarray]:
+        """
+        Convert frame batches to stereo frames, generating stereo pairs across processes.
+        
+        Depth runs in this process; stereo generation is split into one
+        frame range per core on the CPU process pool. Frames, depth maps and
+        stereo output live in one shared-memory block reused for every
+        batch, so workers receive its name and a range instead of pickled
+        arrays.
+        
+        Yields:
+            Stereo frames per batch, uint8 [B, H', W', 3]
+        """
+        workers = os.cpu_count() or 1
+        shared = None
+        views = None
+        try:
+            async for frames_rgb in batches:
+                count = len(frames_rgb)
+                
+                if shared is None:
+                    height, width = frames_rgb[0].shape[:2]
+                    layout = _StereoBatchLayout(
+                        self.settings.depth_batch_size, height, width, conversion_settings.stereo_mode
+                    )
+                    shared = shared_memory.SharedMemory(create=True, size=layout.size)
+                    views = layout.views(shared.buf)
+                frames, depth_maps, stereo = views
+                
+                # Estimate depth for the whole batch in one forward pass. A short
+                # final batch runs padded to the full batch size (the rows past
+                # count are stale and discarded), so every batch has one shape.
+                np.stack(frames_rgb, out=frames[:count])
+                depth = await run_blocking(inference_executor, self._estimate_depth, torch.from_numpy(frames))
+                
+                # 8 bits resolve every integer shift below 256 px (frames up to 5K wide)
+                # at a quarter of the FP32 bandwidth
+                depth_maps[:count] = (depth[:count] * 255).round().to(torch.uint8).cpu().numpy()
+                
+                bounds = np.linspace(0, count, min(workers, count) + 1).astype(int)
+                await asyncio.gather(*(
+                    run_blocking(
+                        get_cpu_executor(), self._generate_stereo_chunk, shared.name, layout, int(start), int(stop)
+                    )
+                    for start, stop in zip(bounds[:-1], bounds[1:])
+                ))
+                
+                # Copied out, as the block is overwritten by the next batch
+                yield stereo[:count].copy()
+                del frames, depth_maps, stereo
+        finally:
+            if shared is not None:
+                views = frames = depth_maps = stereo = None
+                shared.unlink()
+                try:
+                    shared.close()
+                except BufferError:
+                    pass  # A failed step's traceback still holds a view; unmapped once it is freed
     
-    async def _estimate_depth(self, frame: np.ndarray) -> np.ndarray:
-        """Estimate depth map using MiDaS."""
+    @staticmethod
+    def _generate_stereo_chunk(shm_name: str, layout: _StereoBatchLayout, start: int, stop: int) -> None:
+        """Generate stereo frames [start, stop) of a shared-memory batch (runs in a worker process)."""
+        shared = shared_memory.SharedMemory(name=shm_name)
         try:
-            # Preprocess frame for MiDaS
-            input_tensor = self._midas_transforms(frame).to(self.device)
+            frames, depth_maps, stereo = layout.views(shared.buf)
+            VideoProcessingService._generate_stereo_pairs(
+                frames[start:stop], depth_maps[start:stop], layout.stereo_mode, stereo[start:stop]
+            )
+        finally:
+            frames = depth_maps = stereo = None
+            shared.close()
+    
+    async def _convert_batches_gpu(
+        self, 
+        batches: AsyncIterator[List[np.ndarray]], 
+        conversion_settings: ConversionSettings
+    ) -> AsyncIterator[np.ndarray]:
+        """
+        Convert frame batches to stereo frames on the GPU, overlapping transfers with compute.
+        
+        Uploads, depth and stereo generation, and downloads are queued on
+        separate CUDA streams through double-buffered pinned host memory,
+        ordered by events. A batch's stereo frames are only waited for once
+        the next batch has been decoded and queued, so the GPU works on one
+        batch while FFmpeg and the encoder handle its neighbours. Queueing
+        runs on the inference thread and waits on the media pool, so neither
+        the model (or its first-batch compile) nor a sync holds the event loop.
+        
+        Yields:
+            Stereo frames per batch, uint8 [B, H', W', 3], in pinned host
+            memory that is reused two batches later
+        """
+        copy_stream = torch.cuda.Stream()
+        compute_stream = torch.cuda.Stream()
+        download_stream = torch.cuda.Stream()
+        upload_buffers = None
+        download_buffers = None
+        
+        def submit(slot: int, count: int) -> Tuple[torch.Tensor, torch.cuda.Event]:
+            """Queue the upload, conversion and download of a staged batch (inference thread)."""
+            nonlocal download_buffers
+            host_frames = upload_buffers[slot]
+            
+            with torch.cuda.stream(copy_stream):
+                frame_batch = host_frames.to(self.device, non_blocking=True)
+            uploaded = torch.cuda.Event()
+            uploaded.record(copy_stream)
+            
+            with torch.cuda.stream(compute_stream):
+                compute_stream.wait_event(uploaded)
+                frame_batch.record_stream(compute_stream)
+                depth = self._estimate_depth(frame_batch)
+                stereo = self._generate_stereo_gpu(frame_batch, depth, conversion_settings)
+            computed = torch.cuda.Event()
+            computed.record(compute_stream)
+            
+            if download_buffers is None:
+                shape = (self.settings.depth_batch_size,) + tuple(stereo.shape[1:])
+                download_buffers = [torch.empty(shape, dtype=torch.uint8, pin_memory=True) for _ in range(2)]
+            host_stereo = download_buffers[slot][:count]
+            
+            with torch.cuda.stream(download_stream):
+                download_stream.wait_event(computed)
+                stereo.record_stream(download_stream)
+                host_stereo.copy_(stereo[:count], non_blocking=True)
+            downloaded = torch.cuda.Event()
+            downloaded.record(download_stream)
+            return host_stereo, downloaded
+        
+        index = 0
+        pending = None
+        async for frames_rgb in batches:
+            slot = index % 2
+            count = len(frames_rgb)
+            index += 1
+            
+            # Stage the batch in pinned memory so the upload is a true async copy
+            if upload_buffers is None:
+                shape = (self.settings.depth_batch_size,) + frames_rgb[0].shape
+                upload_buffers = [torch.empty(shape, dtype=torch.uint8, pin_memory=True) for _ in range(2)]
+            # A short final batch is padded to the full batch size (with stale
+            # rows that are discarded), so the compiled model or TensorRT engine
+            # sees one input shape per resolution instead of rebuilding
+            np.stack(frames_rgb, out=upload_buffers[slot][:count].numpy())
+            
+            submitted = await run_blocking(inference_executor, submit, slot, count)
+            
+            # Hand over the previous batch while this one is in flight
+            if pending is not None:
+                await run_blocking(media_executor, pending[1].synchronize)
+                yield pending[0].numpy()
+            pending = submitted
+        
+        if pending is not None:
+            await run_blocking(media_executor, pending[1].synchronize)
+            yield pending[0].numpy()
+    
+    @staticmethod
+    def _midas_input_size(height: int, width: int) -> Tuple[int, int]:
+        """
+        Get the MiDaS_small input size for a frame size.
+        
+        Matches the hub's small_transform: scaled to fit within 256 pixels
+        keeping the aspect ratio, then each side rounded to a multiple of 32
+        (rounded down where rounding would exceed 256).
+        """
+        scale = _MIDAS_INPUT_SIZE / max(height, width)
+        
+        def constrain(value: float) -> int:
+            size = int(round(value / _MIDAS_SIZE_MULTIPLE)) * _MIDAS_SIZE_MULTIPLE
+            if size > _MIDAS_INPUT_SIZE:
+                size = int(value // _MIDAS_SIZE_MULTIPLE) * _MIDAS_SIZE_MULTIPLE
+            return max(size, _MIDAS_SIZE_MULTIPLE)
+        
+        return constrain(height * scale), constrain(width * scale)
+    
+    def _estimate_depth(self, frame_batch: torch.Tensor) -> torch.Tensor:
+        """
+        Estimate depth for a batch of frames using MiDaS (blocking; runs on the inference thread).
+        
+        Args:
+            frame_batch: RGB frames, uint8 [B, H, W, 3], on the processing device
+            
+        Returns:
+            FP32 depth, [B, H, W], each map normalized to [0, 1], on the processing device
+        """
+        try:
+            # Load the model (and its normalization constants) before preprocessing
+            model = self.midas_model
+            height, width = frame_batch.shape[1:3]
+            
+            # Preprocess as one batched resize + normalize on the device,
+            # instead of the hub's per-frame OpenCV/numpy transform
+            input_batch = frame_batch.permute(0, 3, 1, 2).float().div_(255)
+            input_batch = torch.nn.functional.interpolate(
+                input_batch,
+                size=self._midas_input_size(height, width),
+                mode="bicubic",
+                align_corners=False
+            )
+            input_batch = ((input_batch - self._midas_mean) / self._midas_std).to(dtype=self._dtype)
             
-            # Estimate depth
-            with torch.no_grad():
-                depth = self.midas_model(input_tensor)
+            # Estimate depth (back in FP32 for upsampling and normalization)
+            with torch.inference_mode():
+                depth = model(input_batch).float()
+                
+                # Bilinear is enough for a map that only drives a sub-5% shift
                 depth = torch.nn.functional.interpolate(
                     depth.unsqueeze(1),
-                    size=frame.shape[:2],
-                    mode="bicubic",
+                    size=(height, width),
+                    mode="bilinear",
                     align_corners=False
-                ).squeeze()
-            
-            # Convert to numpy
-            depth_map = depth.cpu().numpy()
-            
-            # Normalize depth map
-            depth_map = (depth_map - depth_map.min()) / (depth_map.max() - depth_map.min())
+                ).squeeze(1)
+                
+                # Normalize each depth map to [0, 1] while still on the device
+                depth_min = depth.amin(dim=(1, 2), keepdim=True)
+                depth_max = depth.amax(dim=(1, 2), keepdim=True)
+                depth = depth.sub_(depth_min).div_((depth_max - depth_min).clamp_min_(1e-6))
             
-            return depth_map
+            return depth
             
         except Exception as e:
             logger.error(f"Depth estimation failed: {e}")
             raise
     
-    async def _generate_stereo_pair(
+    def _generate_stereo_gpu(
         self, 
-        frame: np.ndarray, 
-        depth_map: np.ndarray, 
+        frame_batch: torch.Tensor, 
+        depth: torch.Tensor, 
         settings: ConversionSettings
-    ) -> np.ndarray:
-        """Generate stereo pair for VR 180°."""
-        try:
-            height, width = frame.shape[:2]
+    ) -> torch.Tensor:
+        """
+        Generate stereo pairs for a batch on the GPU.
+        
+        Each view is resampled from the frame with grid_sample, shifted by
+        the normalized depth (up to 5% of the width) with bilinear
+        filtering; edges clamp like the CPU path.
+        
+        Args:
+            frame_batch: RGB frames, uint8 [B, H, W, 3], on the processing device
+            depth: Normalized depth, [B, H, W], on the processing device
+            settings: Conversion settings
             
-            # Create left and right views
-            left_view = frame.copy()
-            right_view = frame.copy()
+        Returns:
+            Stereo frames, uint8 [B, H', W', 3], on the processing device
+        """
+        try:
+            frame_batch = frame_batch.permute(0, 3, 1, 2).float()  # [B, 3, H, W]
+            batch, _, height, width = frame_batch.shape
             
-            # Apply horizontal shift based on depth
+            # Shift in grid units: adjacent pixels are 2 / (W - 1) apart
             max_shift = int(width * 0.05)  # Maximum 5% shift
+            shift = depth * (max_shift * 2.0 / (width - 1))
             
-            for y in range(height):
-                for x in range(width):
-                    depth_value = depth_map[y, x]
-                    shift = int(depth_value * max_shift)
-                    
-                    # Left view: shift pixels to the right
-                    if x + shift < width:
-                        right_view[y, x + shift] = frame[y, x]
-                    
-                    # Right view: shift pixels to the left
-                    if x - shift >= 0:
-                        left_view[y, x - shift] = frame[y, x]
+            base_y, base_x = torch.meshgrid(
+                torch.linspace(-1.0, 1.0, height, device=self.device),
+                torch.linspace(-1.0, 1.0, width, device=self.device),
+                indexing="ij"
+            )
+            base_x = base_x.expand(batch, -1, -1)
+            base_y = base_y.expand(batch, -1, -1)
+            
+            # Left view samples to the right, right view samples to the left
+            views = []
+            for direction in (1.0, -1.0):
+                grid = torch.stack([base_x + direction * shift, base_y], dim=-1)
+                views.append(torch.nn.functional.grid_sample(
+                    frame_batch, grid, mode="bilinear", padding_mode="border", align_corners=True
+                ))
             
             # Combine into side-by-side stereo
             if settings.stereo_mode == "side-by-side":
-                stereo_frame = np.hstack([left_view, right_view])
+                stereo = torch.cat(views, dim=3)
             else:  # top-bottom
-                stereo_frame = np.vstack([left_view, right_view])
+                stereo = torch.cat(views, dim=2)
             
-            return stereo_frame
+            stereo = stereo.round_().clamp_(0, 255).to(torch.uint8)
+            return stereo.permute(0, 2, 3, 1).contiguous()
             
         except Exception as e:
-            logger.error(f"Stereo pair generation failed: {e}")
+            logger.error(f"GPU stereo generation failed: {e}")
             raise
     
-    async def _generate_vr180_video(
-        self,
-        frames_dir: str,
-        output_path: str,
-        conversion_settings: ConversionSettings,
-        progress_callback=None
+    @staticmethod
+    def _generate_stereo_pairs(
+        frames: np.ndarray, 
+        depth_maps: np.ndarray, 
+        stereo_mode: str,
+        out: np.ndarray
     ) -> None:
-        """Generate VR 180° video from processed frames."""
+        """
+        Generate VR 180° stereo pairs for a batch of frames.
+        
+        Shifts and source indices are computed for the whole batch at once,
+        and each view is gathered straight into its half of the output.
+        
+        Args:
+            frames: RGB frames, uint8 [B, H, W, 3], C-contiguous
+            depth_maps: Normalized depth quantized to uint8 (255 = 1.0), [B, H, W]
+            stereo_mode: "side-by-side" or "top-bottom"
+            out: Stereo frames to fill, uint8 [B, H, 2W, 3] or [B, 2H, W, 3]
+        """
         try:
-            frame_files = sorted([f for f in os.listdir(frames_dir) if f.endswith('.jpg')])
-            
-            if not frame_files:
-                raise ValueError("No processed frames found")
-            
-            # Get frame dimensions
-            first_frame = cv2.imread(os.path.join(frames_dir, frame_files[0]))
-            height, width = first_frame.shape[:2]
-            
-            # Set up FFmpeg
-            input_pattern = os.path.join(frames_dir, "frame_%06d.jpg")
+            batch, height, width = frames.shape[:3]
             
-            # Configure output settings based on conversion settings
-            output_width, output_height = self._get_output_resolution(conversion_settings.resolution)
-            bitrate = self._get_bitrate(conversion_settings.quality, output_width, output_height)
+            # Apply horizontal shift based on depth
+            max_shift = int(width * 0.05)  # Maximum 5% shift
+            shifts = depth_maps.astype(np.intp)
+            shifts *= max_shift
+            shifts //= 255
+            
+            # Each output pixel gathers from its shifted source column (clamped
+            # to the row), as flat indices into the batch's pixel array
+            columns = np.arange(width, dtype=np.intp)
+            row_starts = (np.arange(batch * height, dtype=np.intp) * width).reshape(batch, height, 1)
+            pixels = frames.reshape(-1, frames.shape[3])
+            
+            # Left view samples to the right, right view samples to the left
+            left_src = np.clip(columns + shifts, 0, width - 1)
+            left_src += row_starts
+            right_src = np.clip(columns - shifts, 0, width - 1)
+            right_src += row_starts
             
-            # Build FFmpeg command
-            stream = ffmpeg.input(input_pattern, framerate=conversion_settings.frame_rate)
+            # Combine into side-by-side stereo
+            if stereo_mode == "side-by-side":
+                left_out, right_out = out[:, :, :width], out[:, :, width:]
+            else:  # top-bottom
+                left_out, right_out = out[:, :height], out[:, height:]
             
-            # Apply video filters
-            stream = ffmpeg.filter(stream, 'scale', output_width, output_height)
+            np.take(pixels, left_src, axis=0, out=left_out)
+            np.take(pixels, right_src, axis=0, out=right_out)
             
-            # Set output parameters
+        except Exception as e:
+            logger.error(f"Stereo pair generation failed: {e}")
+            raise
+    
+    def _start_vr180_encoder(
+        self,
+        output_path: str,
+        width: int,
+        height: int,
+        frame_rate: float,
+        conversion_settings: ConversionSettings
+    ):
+        """
+        Start an FFmpeg process encoding raw RGB frames from its stdin.
+        
+        Returns:
+            FFmpeg subprocess; write frames to its stdin, then close it
+        """
+        # Configure output settings based on conversion settings
+        output_width, output_height = self._get_output_resolution(conversion_settings.resolution)
+        bitrate = self._get_bitrate(conversion_settings.quality, output_width, output_height)
+        
+        # Build FFmpeg command
+        stream = ffmpeg.input(
+            'pipe:', format='rawvideo', pix_fmt='rgb24', s=f"{width}x{height}", framerate=frame_rate
+        )
+        
+        # Apply video filters
+        stream = ffmpeg.filter(stream, 'scale', output_width, output_height)
+        
+        # Set output parameters (NVENC on GPU workers, libx264 otherwise)
+        if self.use_hwaccel:
+            stream = ffmpeg.output(
+                stream,
+                output_path,
+                vcodec='h264_nvenc',
+                video_bitrate=bitrate,
+                preset='p4',
+                rc='vbr',
+                cq=23,
+                pix_fmt='yuv420p'
+            )
+        else:
             stream = ffmpeg.output(
                 stream,
                 output_path,
@@ -359,18 +789,10 @@ class VideoProcessingService:
                 crf=23,
                 pix_fmt='yuv420p'
             )
-            
-            # Run FFmpeg
-            ffmpeg.run(stream, overwrite_output=True, quiet=True)
-            
-            if progress_callback:
-                await progress_callback(100, "Video generation completed")
-            
-            logger.info(f"VR 180° video generated: {output_path}")
-            
-        except Exception as e:
-            logger.error(f"VR 180° video generation failed: {e}")
-            raise
+        
+        # Only stdin is piped; FFmpeg's (error-level) log goes to our stderr
+        stream = stream.global_args('-loglevel', 'error', '-nostats')
+        return ffmpeg.run_async(stream, pipe_stdin=True, overwrite_output=True)
     
     async def _generate_thumbnail(self, video_path: str, temp_dir: str) -> str:
         """Generate video thumbnail."""
@@ -380,7 +802,7 @@ class VideoProcessingService:
             # Extract frame at 10% of video duration
             stream = ffmpeg.input(video_path, ss='10%')
             stream = ffmpeg.output(stream, thumbnail_path, vframes=1, format='image2')
-            ffmpeg.run(stream, overwrite_output=True, quiet=True)
+            await run_blocking(media_executor, ffmpeg.run, stream, overwrite_output=True, quiet=True)
             
             return thumbnail_path
             
@@ -391,14 +813,14 @@ class VideoProcessingService:
     async def _get_video_metadata(self, video_path: str) -> Dict[str, Any]:
         """Get video metadata."""
         try:
-            probe = ffmpeg.probe(video_path)
+            probe = await run_blocking(media_executor, ffmpeg.probe, video_path)
             video_stream = next(s for s in probe['streams'] if s['codec_type'] == 'video')
             
             return {
                 'duration': float(probe['format']['duration']),
                 'width': int(video_stream['width']),
                 'height': int(video_stream['height']),
-                'fps': eval(video_stream['r_frame_rate']),
+                'fps': self._parse_frame_rate(video_stream['r_frame_rate']),
                 'bitrate': int(probe['format'].get('bit_rate', 0)),
                 'codec': video_stream['codec_name']
             }
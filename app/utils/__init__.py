@@ -4,11 +4,18 @@ Utility functions for VR 180 Video Processing Platform.
 
 from .validators import validate_video_file, validate_conversion_settings
 from .helpers import generate_video_id, format_file_size, calculate_processing_time
+from .responses import ORJSON_OPTIONS, error_body, orjson_default, orjson_response
+from .fast_uuid import fast_uuid4
 
 __all__ = [
     "validate_video_file",
     "validate_conversion_settings", 
     "generate_video_id",
     "format_file_size",
-    "calculate_processing_time"
+    "calculate_processing_time",
+    "orjson_response",
+    "ORJSON_OPTIONS",
+    "orjson_default",
+    "error_body",
+    "fast_uuid4"
 ]
@@ -4,7 +4,7 @@ Environment variable loader with validation and error handling.
 
 import os
 import sys
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 import logging
 
@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 class EnvironmentLoader:
     """Environment variable loader with validation."""
     
+    # Parsed .env contents keyed by (absolute path, mtime in ns), shared by
+    # all loaders in the process so an unchanged file is parsed only once
+    _file_cache: Dict[Tuple[str, int], Dict[str, str]] = {}
+    
     def __init__(self, env_file: str = ".env"):
         """
         Initialize environment loader.
@@ -76,31 +80,41 @@ class EnvironmentLoader:
             sys.exit(1)
     
     def _load_from_file(self) -> None:
-        """Load variables from .env file."""
+        """Load variables from .env file (parsed again only after it changes)."""
         try:
-            with open(self.env_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse key=value pairs
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
+            path = os.path.abspath(self.env_file)
+            cache_key = (path, os.stat(path).st_mtime_ns)
+            parsed = self._file_cache.get(cache_key)
+            
+            if parsed is None:
+                parsed = {}
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line_num, line in enumerate(f, 1):
+                        line = line.strip()
                         
-                        # Remove quotes if present
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'"):
-                            value = value[1:-1]
+                        # Skip empty lines and comments
+                        if not line or line.startswith('#'):
+                            continue
                         
-                        self.loaded_vars[key] = value
-                    else:
-                        logger.warning(f"Invalid line format in {self.env_file}:{line_num}: {line}")
+                        # Parse key=value pairs
+                        if '=' in line:
+                            key, value = line.split('=', 1)
+                            key = key.strip()
+                            value = value.strip()
+                            
+                            # Remove quotes if present
+                            for quote in ('"', "'"):
+                                if value.startswith(quote) and value.endswith(quote):
+                                    value = value.removeprefix(quote).removesuffix(quote)
+                                    break
+                            
+                            parsed[key] = value
+                        else:
+                            logger.warning(f"Invalid line format in {self.env_file}:{line_num}: {line}")
+                
+                self._file_cache[cache_key] = parsed
+            
+            self.loaded_vars.update(parsed)
                         
         except Exception as e:
             logger.error(f"Error reading {self.env_file}: {e}")
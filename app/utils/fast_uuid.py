@@ -0,0 +1,49 @@
+"""
+UUID4 generation from a pooled buffer of random bytes.
+"""
+
+import os
+import threading
+
+# 4096 UUIDs per os.urandom call
+_BUFFER_SIZE = 65536
+
+_lock = threading.Lock()
+_buf = b""
+_pos = 0
+
+
+def _reset_buffer() -> None:
+    """Discard pooled bytes so a forked worker never reuses its parent's."""
+    global _buf, _pos
+    _buf = b""
+    _pos = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_buffer)
+
+
+def fast_uuid4() -> str:
+    """
+    Generate a random (version 4) UUID string.
+    
+    Equivalent to ``str(uuid.uuid4())`` but draws its 16 random bytes from a
+    pooled buffer, so os.urandom is called once per 4096 UUIDs, and formats
+    them directly instead of building a uuid.UUID.
+    
+    Returns:
+        Hyphenated UUID string
+    """
+    global _buf, _pos
+    with _lock:
+        if _pos >= len(_buf):
+            _buf = os.urandom(_BUFFER_SIZE)
+            _pos = 0
+        raw = bytearray(_buf[_pos:_pos + 16])
+        _pos += 16
+    # Same version (4) and variant (RFC 4122) bits uuid.uuid4 sets
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
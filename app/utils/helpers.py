@@ -2,11 +2,53 @@
 Helper utilities for video processing platform.
 """
 
-import uuid
 import hashlib
+import itertools
+import os
 import time
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+from datetime import datetime, timedelta, timezone
+
+from .fast_uuid import fast_uuid4
+
+_UTC = timezone.utc
+
+# Characters unsafe in filenames, each mapped to '_' in a single translate pass
+_DANGEROUS_TRANS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Read size when hashing files without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Extensions recognised by is_video_file
+_VIDEO_EXTENSIONS = frozenset({
+    'mp4', 'avi', 'mov', 'mkv', 'webm', 'flv', 'wmv', 'm4v', '3gp', 'ogv'
+})
+
+# Binary size units, one per factor of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Base processing time in minutes per GB, scaled by quality and resolution
+_BASE_MINUTES_PER_GB = 5
+_QUALITY_MULTIPLIERS = {
+    "low": 0.5,
+    "medium": 1.0,
+    "high": 1.5,
+    "ultra": 2.0
+}
+_RESOLUTION_MULTIPLIERS = {
+    "720p": 0.5,
+    "1080p": 1.0,
+    "1440p": 1.5,
+    "4K": 2.5
+}
+
+# Minutes per byte for every known (quality, resolution) pair
+_PROCESSING_MINUTES_PER_BYTE = {
+    (quality, resolution): _BASE_MINUTES_PER_GB * quality_multiplier * resolution_multiplier / (1024 ** 3)
+    for quality, quality_multiplier in _QUALITY_MULTIPLIERS.items()
+    for resolution, resolution_multiplier in _RESOLUTION_MULTIPLIERS.items()
+}
 
 
 def generate_video_id() -> str:
@@ -16,7 +58,7 @@ def generate_video_id() -> str:
     Returns:
         Unique video ID string
     """
-    return str(uuid.uuid4())
+    return fast_uuid4()
 
 
 def generate_job_id() -> str:
@@ -26,7 +68,7 @@ def generate_job_id() -> str:
     Returns:
         Unique job ID string
     """
-    return str(uuid.uuid4())
+    return fast_uuid4()
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -42,15 +84,10 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size = float(size_bytes)
+    # Unit index is floor(log1024(size)), straight from the bit length
+    i = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
     
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
-    
-    return f"{size:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 def calculate_processing_time(
@@ -69,32 +106,17 @@ def calculate_processing_time(
     Returns:
         Estimated processing time in minutes
     """
-    # Base processing time in minutes per GB
-    base_time_per_gb = 5
-    
-    # Quality multipliers
-    quality_multipliers = {
-        "low": 0.5,
-        "medium": 1.0,
-        "high": 1.5,
-        "ultra": 2.0
-    }
-    
-    # Resolution multipliers
-    resolution_multipliers = {
-        "720p": 0.5,
-        "1080p": 1.0,
-        "1440p": 1.5,
-        "4K": 2.5
-    }
-    
-    # Calculate estimated time
-    file_size_gb = file_size / (1024 ** 3)
-    base_time = file_size_gb * base_time_per_gb
-    quality_multiplier = quality_multipliers.get(quality, 1.0)
-    resolution_multiplier = resolution_multipliers.get(resolution, 1.0)
-    
-    estimated_time = int(base_time * quality_multiplier * resolution_multiplier)
+    minutes_per_byte = _PROCESSING_MINUTES_PER_BYTE.get((quality, resolution))
+    if minutes_per_byte is None:
+        # Unknown settings count as 1.0x
+        minutes_per_byte = (
+            _BASE_MINUTES_PER_GB
+            * _QUALITY_MULTIPLIERS.get(quality, 1.0)
+            * _RESOLUTION_MULTIPLIERS.get(resolution, 1.0)
+            / (1024 ** 3)
+        )
+    
+    estimated_time = int(file_size * minutes_per_byte)
     
     # Minimum processing time
     return max(estimated_time, 2)
@@ -102,24 +124,47 @@ def calculate_processing_time(
 
 def generate_file_hash(file_path: str) -> str:
     """
-    Generate MD5 hash for a file.
+    Generate a SHA-256 hash for a file.
     
     Args:
         file_path: Path to the file
         
     Returns:
-        MD5 hash string
+        Hex digest string, truncated to 32 characters like the MD5 it replaces
     """
-    hash_md5 = hashlib.md5()
     try:
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            # SHA-256 runs on the SHA extensions (SHA-NI / ARMv8) in OpenSSL;
+            # Python 3.11+ also runs the read loop in C without holding the GIL
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()[:32]
+            
+            file_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+            return file_hash.hexdigest()[:32]
     except Exception:
         return ""
 
 
+def generate_file_hashes(file_paths: Iterable[str], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Generate hashes for many files in parallel.
+    
+    hashlib releases the GIL while hashing large buffers (and file reads
+    release it too), so threads overlap I/O and hash on separate cores.
+    
+    Args:
+        file_paths: Paths of the files to hash
+        max_workers: Thread count (defaults to the CPU count)
+        
+    Returns:
+        Hashes in the same order as file_paths ("" for unreadable files)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(generate_file_hash, file_paths))
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe storage.
@@ -131,9 +176,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove or replace dangerous characters
-    dangerous_chars = '<>:"/\\|?*'
-    for char in dangerous_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_DANGEROUS_TRANS)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -142,13 +185,14 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         filename = f"file_{int(time.time())}"
     
-    # Limit length
-    if len(filename) > 255:
-        name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
-        max_name_length = 255 - len(ext) - 1 if ext else 255
-        filename = name[:max_name_length] + (f'.{ext}' if ext else '')
+    # Limit length (almost every name already fits)
+    if len(filename) <= 255:
+        return filename
     
-    return filename
+    name, dot, ext = filename.rpartition('.')
+    if not dot:
+        return filename[:255]
+    return name[:255 - len(ext) - 1] + dot + ext
 
 
 def get_file_extension(filename: str) -> str:
@@ -161,9 +205,8 @@ def get_file_extension(filename: str) -> str:
     Returns:
         File extension (without dot)
     """
-    if '.' in filename:
-        return filename.rsplit('.', 1)[1].lower()
-    return ""
+    dot = filename.rfind('.')
+    return filename[dot + 1:].lower() if dot != -1 else ""
 
 
 def is_video_file(filename: str) -> bool:
@@ -176,11 +219,8 @@ def is_video_file(filename: str) -> bool:
     Returns:
         True if video file, False otherwise
     """
-    video_extensions = {
-        'mp4', 'avi', 'mov', 'mkv', 'webm', 'flv', 'wmv', 'm4v', '3gp', 'ogv'
-    }
-    extension = get_file_extension(filename)
-    return extension in video_extensions
+    dot = filename.rfind('.')
+    return dot != -1 and filename[dot + 1:].lower() in _VIDEO_EXTENSIONS
 
 
 def format_duration(seconds: float) -> str:
@@ -208,9 +248,9 @@ def get_utc_timestamp() -> datetime:
     Get current UTC timestamp.
     
     Returns:
-        Current UTC datetime
+        Current timezone-aware UTC datetime
     """
-    return datetime.utcnow()
+    return datetime.now(_UTC)
 
 
 def add_timezone_offset(dt: datetime, hours: int = 0) -> datetime:
@@ -235,9 +275,9 @@ def create_expiration_time(minutes: int = 60) -> datetime:
         minutes: Minutes from now
         
     Returns:
-        Expiration datetime
+        Timezone-aware UTC expiration datetime
     """
-    return datetime.utcnow() + timedelta(minutes=minutes)
+    return datetime.now(_UTC) + timedelta(minutes=minutes)
 
 
 def is_expired(expiration_time: datetime) -> bool:
@@ -245,26 +285,61 @@ def is_expired(expiration_time: datetime) -> bool:
     Check if expiration time has passed.
     
     Args:
-        expiration_time: Expiration datetime
+        expiration_time: Expiration datetime (naive values are taken as UTC)
         
     Returns:
         True if expired, False otherwise
     """
-    return datetime.utcnow() > expiration_time
+    if expiration_time.tzinfo is None:
+        expiration_time = expiration_time.replace(tzinfo=_UTC)
+    return datetime.now(_UTC) > expiration_time
 
 
-def chunk_list(lst: list, chunk_size: int) -> list:
+def are_expired(expiration_times: Iterable[datetime]) -> List[bool]:
+    """
+    Check many expiration times against one reading of the clock.
+    
+    Args:
+        expiration_times: Expiration datetimes (naive values are taken as UTC)
+        
+    Returns:
+        Whether each has passed, in input order
+    """
+    now = datetime.now(_UTC)
+    naive_now = now.replace(tzinfo=None)
+    return [
+        (naive_now if expiration_time.tzinfo is None else now) > expiration_time
+        for expiration_time in expiration_times
+    ]
+
+
+def chunk_iter(items: Iterable, chunk_size: int) -> Iterator[List]:
+    """
+    Lazily split an iterable into chunks of specified size.
+    
+    Args:
+        items: Iterable to chunk (consumed once)
+        chunk_size: Size of each chunk
+        
+    Returns:
+        Iterator of lists, the last one possibly shorter
+    """
+    it = iter(items)
+    return iter(lambda: list(itertools.islice(it, chunk_size)), [])
+
+
+def chunk_list(lst: Iterable, chunk_size: int) -> list:
     """
     Split list into chunks of specified size.
     
     Args:
-        lst: List to chunk
+        lst: List (or any iterable) to chunk
         chunk_size: Size of each chunk
         
     Returns:
         List of chunks
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    return list(chunk_iter(lst, chunk_size))
 
 
 def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
@@ -277,9 +352,14 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Merged dictionary
     """
-    result = {}
-    for d in dicts:
-        result.update(d)
+    if not dicts:
+        return {}
+    
+    # Copying the first dict clones its table in one allocation
+    result = dict(dicts[0])
+    for d in dicts[1:]:
+        if d:
+            result.update(d)
     return result
 
 
@@ -0,0 +1,84 @@
+"""
+Response helpers for pre-serialized JSON and the shared error payload.
+"""
+
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi import Response, status
+from pydantic import BaseModel
+
+# Format datetimes the way pydantic's JSON mode does: naive values keep no
+# offset and aware UTC values get a "Z" suffix
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Fallback for values orjson does not serialize natively.
+    
+    orjson only handles exact datetime instances; Firestore returns a
+    datetime subclass (DatetimeWithNanoseconds), so rebuild a plain
+    datetime and let orjson format it.
+    
+    Args:
+        obj: Value orjson could not serialize
+        
+    Returns:
+        A value orjson can serialize
+        
+    Raises:
+        TypeError: If the value is not supported
+    """
+    if isinstance(obj, datetime):
+        return datetime(
+            obj.year, obj.month, obj.day, obj.hour, obj.minute,
+            obj.second, obj.microsecond, obj.tzinfo
+        )
+    raise TypeError
+
+
+def error_body(error: str, message: str, details: Any = None, timestamp: Any = None) -> dict:
+    """
+    Build the error payload returned by the global exception handlers.
+    
+    Args:
+        error: Error category, e.g. "HTTP Error"
+        message: Human-readable error message
+        details: Optional extra error details
+        timestamp: Optional time the error occurred
+        
+    Returns:
+        Error payload dictionary
+    """
+    return {
+        "error": error,
+        "message": message,
+        "details": details,
+        "timestamp": timestamp
+    }
+
+
+def orjson_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a model with orjson and wrap it in a Response.
+    
+    Returning a Response directly skips FastAPI's response-model validation
+    and jsonable_encoder pass. The model is dumped in python mode so
+    datetimes reach orjson as objects and are formatted in Rust.
+    
+    Args:
+        model: Pydantic model to serialize
+        status_code: HTTP status code
+        
+    Returns:
+        JSON response containing the serialized model
+    """
+    return Response(
+        content=orjson.dumps(
+            model.model_dump(mode="python"), default=orjson_default, option=ORJSON_OPTIONS
+        ),
+        media_type="application/json",
+        status_code=status_code
+    )
@@ -2,12 +2,29 @@
 Validation utilities for video processing platform.
 """
 
-import re
+import string
 from typing import Dict, Any, List
 from fastapi import HTTPException, status
 
 from app.config import get_settings
 
+# Characters not allowed in uploaded filenames
+_DANGEROUS_CHARS = frozenset('<>:"/\\|?*')
+
+# Accepted conversion setting values (formats and resolutions come from settings)
+_VALID_QUALITIES = frozenset({"low", "medium", "high", "ultra"})
+_VALID_STEREO_MODES = frozenset({"side-by-side", "top-bottom"})
+
+# Email address character classes: local@domain.tld
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+_EMAIL_DOMAIN_CHARS = _EMAIL_TLD_CHARS | frozenset(string.digits + '.-')
+_EMAIL_LOCAL_CHARS = _EMAIL_DOMAIN_CHARS | frozenset('_%+')
+
+# Password character classes (ASCII letters, like the [A-Z]/[a-z] classes they replace)
+_UPPER_CHARS = frozenset(string.ascii_uppercase)
+_LOWER_CHARS = frozenset(string.ascii_lowercase)
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
 
 def validate_video_file(filename: str, content_type: str, file_size: int) -> Dict[str, Any]:
     """
@@ -31,7 +48,7 @@ def validate_video_file(filename: str, content_type: str, file_size: int) -> Dic
         errors.append("Invalid filename")
     
     # Check for dangerous characters
-    if re.search(r'[<>:"/\\|?*]', filename):
+    if not _DANGEROUS_CHARS.isdisjoint(filename):
         errors.append("Filename contains invalid characters")
     
     # Get settings
@@ -88,8 +105,7 @@ def validate_conversion_settings(settings_dict: Dict[str, Any]) -> Dict[str, Any
     # Validate quality
     if "quality" in settings_dict:
         quality = settings_dict["quality"]
-        valid_qualities = ["low", "medium", "high", "ultra"]
-        if quality not in valid_qualities:
+        if quality not in _VALID_QUALITIES:
             errors.append(f"Invalid quality setting: {quality}")
     
     # Validate frame rate
@@ -107,8 +123,7 @@ def validate_conversion_settings(settings_dict: Dict[str, Any]) -> Dict[str, Any
     # Validate stereo mode
     if "stereo_mode" in settings_dict:
         stereo_mode = settings_dict["stereo_mode"]
-        valid_modes = ["side-by-side", "top-bottom"]
-        if stereo_mode not in valid_modes:
+        if stereo_mode not in _VALID_STEREO_MODES:
             errors.append(f"Invalid stereo mode: {stereo_mode}")
     
     if errors:
@@ -130,8 +145,19 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # Structural check equivalent to ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$
+    # in linear time: only the last dot can start a letters-only TLD
+    local, at, domain = email.partition('@')
+    if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    
+    name, dot, tld = domain.rpartition('.')
+    return (
+        bool(dot and name)
+        and len(tld) >= 2
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+        and _EMAIL_DOMAIN_CHARS.issuperset(name)
+    )
 
 
 def validate_password_strength(password: str) -> List[str]:
@@ -149,16 +175,28 @@ def validate_password_strength(password: str) -> List[str]:
     if len(password) < 8:
         errors.append("Password must be at least 8 characters long")
     
-    if not re.search(r'[A-Z]', password):
+    # Classify every character in one pass instead of one regex scan per class
+    has_upper = has_lower = has_digit = has_special = False
+    for char in password:
+        if char in _UPPER_CHARS:
+            has_upper = True
+        elif char in _LOWER_CHARS:
+            has_lower = True
+        elif char.isdecimal():
+            has_digit = True
+        elif char in _SPECIAL_CHARS:
+            has_special = True
+    
+    if not has_upper:
         errors.append("Password must contain at least one uppercase letter")
     
-    if not re.search(r'[a-z]', password):
+    if not has_lower:
         errors.append("Password must contain at least one lowercase letter")
     
-    if not re.search(r'\d', password):
+    if not has_digit:
         errors.append("Password must contain at least one digit")
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not has_special:
         errors.append("Password must contain at least one special character")
     
     return errors
@@ -3,17 +3,25 @@
 Startup script for VR 180 Video Processing Platform.
 """
 
+import os
+
 import uvicorn
 from app.config import get_settings
 
 if __name__ == "__main__":
     settings = get_settings()
     
+    # Debug runs a single reloading worker; production starts one per CPU
+    workers = 1 if settings.debug else (settings.workers or os.cpu_count() or 1)
+    
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
+        loop="uvloop",  # uvloop and httptools ship with uvicorn[standard]
+        http="httptools",
+        workers=workers,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
-        access_log=True
+        access_log=settings.debug
     )
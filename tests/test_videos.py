@@ -1,10 +1,19 @@
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from app.main import app
 
-client = TestClient(app)
+# Share one event loop across the module so the session-scoped client stays usable
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-def test_create_video():
-    response = client.post("/videos/", json={"title": "Test Video", "description": "A test video"})
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    # Calls the ASGI app in-process, without TestClient's sync HTTP shim
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+async def test_create_video(client):
+    response = await client.post("/videos/", json={"title": "Test Video", "description": "A test video"})
     assert response.status_code == 200
-    assert response.json() == {"message": "Video created successfully"}
\ No newline at end of file
+    assert response.json() == {"message": "Video created successfully"}